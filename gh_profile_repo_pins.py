@@ -1,15 +1,19 @@
 from gh_profile_repo_pins.utils import parse_args, get_logger, Logger
 from gh_profile_repo_pins.repo_pins import ReadMeRepoPins
+from gh_profile_repo_pins.repo_pins_transport import RepoPinsTransport
 
 
 def gh_readme_repo_pins():
     log: Logger = get_logger()
     try:
-        custom_gh_readme_repo_pins: ReadMeRepoPins = ReadMeRepoPins(*parse_args())
-    except AssertionError as err:
-        log.error(msg=str(err))
-        exit(1)
-    custom_gh_readme_repo_pins.generate()
+        try:
+            custom_gh_readme_repo_pins: ReadMeRepoPins = ReadMeRepoPins(*parse_args())
+        except AssertionError as err:
+            log.error(msg=str(err))
+            exit(1)
+        custom_gh_readme_repo_pins.generate()
+    finally:
+        RepoPinsTransport.close_shared()  # release pooled keep-alive connections
 
 
 if __name__ == "__main__":
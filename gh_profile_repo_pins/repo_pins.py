@@ -5,10 +5,13 @@ from gh_profile_repo_pins.repo_pins_exceptions import (
     RepoPinStatsError,
 )
 from gh_profile_repo_pins.repo_pins_data.repo_pins_api import GitHubApiClient
+from gh_profile_repo_pins.repo_pins_data.repo_pins_async import GitHubApiAsyncClient
 from gh_profile_repo_pins.repo_pins_data.repo_pins_stats import RepoPinStats
 from gh_profile_repo_pins.utils import set_git_creds, get_logger, Logger
 from gh_profile_repo_pins.repo_pins_generate import GenerateRepoPins
 import gh_profile_repo_pins.repo_pins_enum as enums
+from concurrent.futures import ThreadPoolExecutor, Future
+from asyncio import run, gather, to_thread
 from random import seed, sample
 from datetime import datetime
 
@@ -34,11 +37,22 @@ class ReadMeRepoPins:
         is_exclude_repos_contributed: bool = False,
         repo_owner: str = None,
         is_contribution_stats: bool = False,
+        is_async_fetch: bool = False,
+        is_cache_bypass: bool = False,
+        contribution_stats_metric: str = None,
+        contribution_stats_window: str = None,
+        contribution_stats_backend: str = None,
+        is_cache_mirrors: bool = False,
+        contribution_stats_exclude_paths: str = None,
+        is_contribution_stats_no_renames: bool = False,
     ) -> None:
         self.__log: Logger = get_logger()
         try:
             self.__gh_api_client: GitHubApiClient = GitHubApiClient(
-                api_token=api_token, username=username
+                api_token=api_token,
+                username=username,
+                is_prefetch_pinned=not repo_names_exclusive,
+                is_cache_bypass=is_cache_bypass,
             )
         except GitHubGraphQlClientError as err:
             self.__log.error(msg=err.msg)
@@ -100,8 +114,41 @@ class ReadMeRepoPins:
         )
 
         self.__is_contribution_stats: bool = is_contribution_stats
+        self.__is_async_fetch: bool = is_async_fetch
         self.__repo_stats: RepoPinStats = (
-            RepoPinStats(gh_token=api_token) if self.__is_contribution_stats else None
+            RepoPinStats(
+                gh_token=api_token,
+                is_mirror=is_cache_mirrors,
+                is_cache_bypass=is_cache_bypass,
+                is_detect_renames=not is_contribution_stats_no_renames,
+                exclude_paths=(
+                    [
+                        path_pattern.strip()
+                        for path_pattern in contribution_stats_exclude_paths.split(",")
+                        if path_pattern.strip() != ""
+                    ]
+                    if contribution_stats_exclude_paths
+                    else None
+                ),
+                stats_metric=(
+                    enums.RepoPinStatsMetricEnum(contribution_stats_metric.lower())
+                    if contribution_stats_metric
+                    else None
+                ),
+                stats_window=(
+                    int(contribution_stats_window)
+                    if contribution_stats_window
+                    else None
+                ),
+                gh_api_client=self.__gh_api_client,
+                stats_backend=(
+                    enums.RepoPinStatsBackendEnum(contribution_stats_backend.lower())
+                    if contribution_stats_backend
+                    else None
+                ),
+            )
+            if self.__is_contribution_stats
+            else None
         )
 
     def __order_repos_by_exclusive_preference(self) -> None:
@@ -138,10 +185,16 @@ class ReadMeRepoPins:
                     population=self.__repo_pins, k=len(self.__repo_pins)
                 )[: self.__max_num_pins]
             else:
+                # names are compared case-insensitively, as GitHub orders the fetched top n
                 self.__repo_pins = sorted(
                     self.__repo_pins,
                     key=lambda d: next(
-                        (v for k, v in d.items() if order_field.upper() == k.upper()), 0
+                        (
+                            v.lower() if isinstance(v, str) else v
+                            for k, v in d.items()
+                            if order_field.upper() == k.upper()
+                        ),
+                        0,
                     ),
                     reverse=(
                         True
@@ -163,84 +216,187 @@ class ReadMeRepoPins:
         )
         gen_repo_pins.grid_display()
 
-    def generate(self) -> None:
-        try:
-            if self.__repo_names_exclusive:
-                for owner_repo in self.__repo_names_exclusive:
-                    if not any(
-                        [
-                            d[enums.RepoPinsResDictKeys.URL.value]
-                            .lower()
-                            .endswith(owner_repo.lower())
-                            for d in self.__repo_pins
-                            if d.get(enums.RepoPinsResDictKeys.URL.value)
-                        ]
-                    ):
-                        owner, repo = owner_repo.split("/")
-                        self.__repo_pins.append(
-                            self.__gh_api_client.fetch_single_repo_data(
-                                repo_owner=owner,
-                                repo_name=repo,
-                            )
-                        )
-            else:
-                self.__repo_pins: list[dict[str, str | int | dict]] = (
-                    self.__gh_api_client.fetch_pinned_repo_data()
+    def __get_exclusive_owner_repos(self) -> list[str]:
+        return list(
+            {  # de-duplicate case-insensitively, keeping input order
+                owner_repo.lower(): owner_repo
+                for owner_repo in self.__repo_names_exclusive
+            }.values()
+        )
+
+    def __get_fetch_order_field(self) -> enums.RepositoryOrderFieldEnum:
+        return (
+            self.__repo_priority_order
+            if self.__repo_priority_order
+            and self.__repo_priority_order is not enums.RepositoryOrderFieldEnum.RANDOM
+            else self.__DEFAULT_ORDER_FIELD
+        )
+
+    def __get_fetch_max_num_repos(self) -> int | None:
+        # randomly ordered pins sample from all repos, otherwise the top n server-ordered suffice
+        return (
+            self.__max_num_pins
+            if self.__repo_priority_order is not enums.RepositoryOrderFieldEnum.RANDOM
+            else None
+        )
+
+    def __merge_repo_data(
+        self,
+        pinned_repos: list[dict[str, str | int | dict]],
+        owned_repos: list[dict[str, str | int | dict]],
+        contributed_repos: list[dict[str, str | int | dict]],
+    ) -> list[dict[str, str | int | dict]]:
+        repo_data: list[dict[str, str | int | dict]] = list(pinned_repos)
+        if len(repo_data) >= self.__max_num_pins:
+            return repo_data
+        repo_urls: set[str] = {
+            d.get(enums.RepoPinsResDictKeys.URL.value) for d in repo_data
+        }
+        for repo in owned_repos + contributed_repos:
+            if repo.get(enums.RepoPinsResDictKeys.URL.value) not in repo_urls:
+                repo_urls.add(repo.get(enums.RepoPinsResDictKeys.URL.value))
+                repo_data.append(repo)
+        return repo_data
+
+    def __is_exclude_repos(self, is_contributed: bool = False) -> bool:
+        return (
+            self.__is_exclude_repos_contributed
+            if is_contributed
+            else self.__is_exclude_repos_owned
+        )
+
+    def __fetch_owned_or_contributed(
+        self, pinned_repo_urls: list[str], is_contributed: bool = False
+    ) -> list[dict[str, str | int | dict]]:
+        if self.__is_exclude_repos(is_contributed=is_contributed):
+            return []
+        return self.__gh_api_client.fetch_owned_or_contributed_to_repo_data(
+            order_field=self.__get_fetch_order_field(),
+            pinned_repo_urls=pinned_repo_urls,
+            is_contributed=is_contributed,
+            max_num_repos=self.__get_fetch_max_num_repos(),
+        )
+
+    async def __fetch_owned_or_contributed_async(
+        self,
+        gh_api_async_client: GitHubApiAsyncClient,
+        pinned_repo_urls: list[str],
+        is_contributed: bool = False,
+    ) -> list[dict[str, str | int | dict]]:
+        if self.__is_exclude_repos(is_contributed=is_contributed):
+            return []
+        return await gh_api_async_client.fetch_owned_or_contributed_to_repo_data(
+            order_field=self.__get_fetch_order_field(),
+            pinned_repo_urls=pinned_repo_urls,
+            is_contributed=is_contributed,
+            max_num_repos=self.__get_fetch_max_num_repos(),
+        )
+
+    async def __fetch_repo_pins_async(self) -> None:
+        gh_api_async_client: GitHubApiAsyncClient = GitHubApiAsyncClient(
+            gh_api_client=self.__gh_api_client
+        )
+        if self.__repo_names_exclusive:
+            self.__repo_pins.extend(
+                await gh_api_async_client.fetch_multiple_repo_data(
+                    owner_repos=self.__get_exclusive_owner_repos()
                 )
-                owned_repos: list[dict[str, str | int | dict]] = []
-                contributed_repos: list[dict[str, str | int | dict]] = []
-                if (
-                    len(self.__repo_pins) < self.__max_num_pins
-                    and not self.__is_exclude_repos_owned
-                ):
-                    owned_repos.extend(
-                        self.__gh_api_client.fetch_owned_or_contributed_to_repo_data(
-                            order_field=(
-                                self.__repo_priority_order
-                                if self.__repo_priority_order
-                                is not enums.RepositoryOrderFieldEnum.RANDOM
-                                else self.__DEFAULT_ORDER_FIELD
-                            ),
-                            pinned_repo_urls=[
-                                d[enums.RepoPinsResDictKeys.URL.value]
-                                for d in self.__repo_pins
-                            ],
-                        )
+            )
+        else:
+            # prefetched with the client bootstrap query, so does not cost a round trip
+            pinned_repos: list[dict[str, str | int | dict]] = (
+                await gh_api_async_client.fetch_pinned_repo_data()
+            )
+            owned_repos: list[dict[str, str | int | dict]] = []
+            contributed_repos: list[dict[str, str | int | dict]] = []
+            if len(pinned_repos) < self.__max_num_pins:
+                pinned_repo_urls: list[str] = [
+                    d[enums.RepoPinsResDictKeys.URL.value] for d in pinned_repos
+                ]
+                owned_repos, contributed_repos = await gather(
+                    self.__fetch_owned_or_contributed_async(
+                        gh_api_async_client=gh_api_async_client,
+                        pinned_repo_urls=pinned_repo_urls,
+                    ),
+                    self.__fetch_owned_or_contributed_async(
+                        gh_api_async_client=gh_api_async_client,
+                        pinned_repo_urls=pinned_repo_urls,
+                        is_contributed=True,
+                    ),
+                )
+            self.__repo_pins = self.__merge_repo_data(
+                pinned_repos=pinned_repos,
+                owned_repos=owned_repos,
+                contributed_repos=contributed_repos,
+            )
+        self.__order_repos_by_preference()
+
+        if self.__is_contribution_stats and self.__repo_stats:
+            self.__repo_pins = await to_thread(
+                self.__repo_stats.fetch_contribution_stats, repo_list=self.__repo_pins
+            )
+        else:
+            self.__repo_pins = await gh_api_async_client.fetch_contributor_stats(
+                repo_list=self.__repo_pins
+            )
+
+    def __fetch_repo_pins(self) -> None:
+        if self.__repo_names_exclusive:
+            self.__repo_pins.extend(
+                self.__gh_api_client.fetch_multiple_repo_data(
+                    owner_repos=self.__get_exclusive_owner_repos()
+                )
+            )
+        else:
+            pinned_repos: list[dict[str, str | int | dict]] = (
+                self.__gh_api_client.fetch_pinned_repo_data()
+            )
+            owned_repos: list[dict[str, str | int | dict]] = []
+            contributed_repos: list[dict[str, str | int | dict]] = []
+            if len(pinned_repos) < self.__max_num_pins:
+                pinned_repo_urls: list[str] = [
+                    d[enums.RepoPinsResDictKeys.URL.value] for d in pinned_repos
+                ]
+                # independent paginations, de-duplicated against each other when merged
+                with ThreadPoolExecutor(max_workers=2) as thread_pool:
+                    owned_repos_future: Future = thread_pool.submit(
+                        self.__fetch_owned_or_contributed,
+                        pinned_repo_urls=pinned_repo_urls,
                     )
-                if (
-                    len(self.__repo_pins) < self.__max_num_pins
-                    and not self.__is_exclude_repos_contributed
-                ):
-                    contributed_repos.extend(
-                        self.__gh_api_client.fetch_owned_or_contributed_to_repo_data(
-                            order_field=(
-                                self.__repo_priority_order
-                                if self.__repo_priority_order
-                                is not enums.RepositoryOrderFieldEnum.RANDOM
-                                else self.__DEFAULT_ORDER_FIELD
-                            ),
-                            pinned_repo_urls=[
-                                d[enums.RepoPinsResDictKeys.URL.value]
-                                for d in self.__repo_pins
-                            ],
-                            is_contributed=True,
-                        )
+                    contributed_repos_future: Future = thread_pool.submit(
+                        self.__fetch_owned_or_contributed,
+                        pinned_repo_urls=pinned_repo_urls,
+                        is_contributed=True,
                     )
-                self.__repo_pins.extend(owned_repos)
-                self.__repo_pins.extend(contributed_repos)
-            self.__order_repos_by_preference()
+                    owned_repos = owned_repos_future.result()
+                    contributed_repos = contributed_repos_future.result()
+            self.__repo_pins = self.__merge_repo_data(
+                pinned_repos=pinned_repos,
+                owned_repos=owned_repos,
+                contributed_repos=contributed_repos,
+            )
+        self.__order_repos_by_preference()
 
-            if self.__is_contribution_stats and self.__repo_stats:
-                self.__repo_pins = self.__repo_stats.fetch_contribution_stats(
-                    repo_list=self.__repo_pins
-                )
+        if self.__is_contribution_stats and self.__repo_stats:
+            self.__repo_pins = self.__repo_stats.fetch_contribution_stats(
+                repo_list=self.__repo_pins
+            )
+        else:
+            self.__repo_pins = self.__gh_api_client.fetch_contributor_stats(
+                repo_list=self.__repo_pins
+            )
+
+    def generate(self) -> None:
+        try:
+            if self.__is_async_fetch:
+                run(self.__fetch_repo_pins_async())
             else:
-                self.__repo_pins = self.__gh_api_client.fetch_contributor_stats(
-                    repo_list=self.__repo_pins
-                )
+                self.__fetch_repo_pins()
 
             self.__log.info(
-                msg=f"Total API fetch cost: {self.__gh_api_client.fetch_cost}"
+                msg=f"Total API fetch cost: {self.__gh_api_client.fetch_cost} "
+                f"(cache hits: {self.__gh_api_client.cache_hits}, "
+                f"cost saved: {self.__gh_api_client.cache_cost_saved})"
             )
         except (GitHubGraphQlClientError, RepoPinStatsError) as err:
             self.__log.error(msg=err.msg)
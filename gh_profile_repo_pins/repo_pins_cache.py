@@ -0,0 +1,101 @@
+from gh_profile_repo_pins.utils import CACHE_DIR
+from json import dump, load, JSONDecodeError
+from os import replace, utime, getpid
+from threading import Lock, get_ident
+from hashlib import sha256
+from pathlib import Path
+from time import time
+
+
+class RepoPinsCache:
+
+    __DEFAULT_MAX_SIZE: int = 64 * 1024 * 1024  # bytes
+    __FILE_EXT: str = ".json"
+    __TMP_FILE_EXT: str = ".tmp"
+
+    __KEY: str = "key"
+    __CREATED: str = "created"
+    __VALUE: str = "value"
+
+    def __init__(
+        self, namespace: str, cache_dir: str = None, max_size: int = None
+    ) -> None:
+        self.__cache_dir: Path = Path(cache_dir if cache_dir else CACHE_DIR).joinpath(
+            namespace
+        )
+        try:
+            self.__cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # caching is best effort, reads miss and writes are skipped
+        self.__max_size: int = max_size if max_size else self.__DEFAULT_MAX_SIZE
+        self.__cache_size: int | None = None  # lazily summed on first write
+        self.__cache_lock: Lock = Lock()
+
+    def __get_path(self, key: str) -> Path:
+        return self.__cache_dir.joinpath(
+            sha256(key.encode(encoding="utf-8")).hexdigest() + self.__FILE_EXT
+        )
+
+    def __get_entries(self) -> list[tuple[Path, float, int]]:
+        entries: list[tuple[Path, float, int]] = []
+        for entry_path in self.__cache_dir.glob(f"*{self.__FILE_EXT}"):
+            try:
+                entry_stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((entry_path, entry_stat.st_mtime, entry_stat.st_size))
+        return entries
+
+    def __evict(self) -> None:
+        # least recently used first, as reads refresh the entry mtime
+        for entry_path, _, entry_size in sorted(
+            self.__get_entries(), key=lambda entry: entry[1]
+        ):
+            if self.__cache_size <= self.__max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            self.__cache_size -= entry_size
+
+    @property
+    def cache_dir(self) -> str:
+        return str(self.__cache_dir)
+
+    def get(self, key: str, ttl: int = None) -> dict | list | str | int | None:
+        entry_path: Path = self.__get_path(key=key)
+        try:
+            with open(file=entry_path, mode="r", encoding="utf-8") as entry_file:
+                entry: dict = load(entry_file)
+            if entry.get(self.__KEY) != key:
+                return None
+            if ttl is not None and time() - entry.get(self.__CREATED, 0) > ttl:
+                return None
+            utime(path=entry_path)
+            return entry.get(self.__VALUE)
+        except (OSError, JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: dict | list | str | int) -> None:
+        entry_path: Path = self.__get_path(key=key)
+        tmp_path: Path = entry_path.with_suffix(
+            f".{getpid()}.{get_ident()}{self.__TMP_FILE_EXT}"
+        )
+        try:
+            with open(file=tmp_path, mode="w", encoding="utf-8") as entry_file:
+                dump(
+                    obj={self.__KEY: key, self.__CREATED: time(), self.__VALUE: value},
+                    fp=entry_file,
+                    separators=(",", ":"),
+                )
+            with self.__cache_lock:
+                prev_size: int = entry_path.stat().st_size if entry_path.exists() else 0
+                replace(src=tmp_path, dst=entry_path)
+                if self.__cache_size is None:
+                    self.__cache_size = sum(
+                        entry_size for _, _, entry_size in self.__get_entries()
+                    )
+                else:
+                    self.__cache_size += entry_path.stat().st_size - prev_size
+                if self.__cache_size > self.__max_size:
+                    self.__evict()
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
@@ -1,17 +1,22 @@
 from requests import (
-    post,
     Response,
-    Session,
     Timeout,
     HTTPError,
     RequestException,
     ConnectionError,
 )
 from gh_profile_repo_pins.repo_pins_exceptions import GitHubGraphQlClientError
+from gh_profile_repo_pins.repo_pins_transport import RepoPinsTransport
+from gh_profile_repo_pins.repo_pins_data.repo_pins_scheduler import GitHubApiScheduler
+from gh_profile_repo_pins.repo_pins_cache import RepoPinsCache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import gh_profile_repo_pins.repo_pins_enum as enums
 from dataclasses import dataclass
-from threading import local, Lock
+from hashlib import sha256
+from json import dumps
+from threading import Lock
+from typing import Iterator
+from urllib.parse import urlparse, parse_qs
 from http import HTTPStatus
 from time import sleep
 
@@ -31,6 +36,7 @@ class GitHubApiClient:
       name
       stargazerCount
       forkCount
+      diskUsage
       issues(states: OPEN) { totalCount }
       issuesHelp: issues(labels: ["help wanted"], states: OPEN) { totalCount }
       pullRequests(states: OPEN) { totalCount }
@@ -50,14 +56,11 @@ class GitHubApiClient:
     __GRAPH_QL_RATE_LIMIT_STR: str = """
       rateLimit { cost }
     """
-    __GRAPH_QL_REPO_PIN_QUERY_STR: str = f"""
-    query ($login: String!, $num: Int!) {{
-      {__GRAPH_QL_RATE_LIMIT_STR}
-      user(login: $login) {{
-        pinnedItems(
+    __GRAPH_QL_REPO_PIN_ITEMS_ARGS: str = """
           first: $num
           types: [REPOSITORY]
-        ) {{
+    """
+    __GRAPH_QL_REPO_PIN_ITEMS_EDGES: str = f"""
           edges {{
             node {{
               ... on Repository {{
@@ -65,6 +68,15 @@ class GitHubApiClient:
               }}
             }}
           }}
+    """
+    __GRAPH_QL_REPO_PIN_QUERY_STR: str = f"""
+    query ($login: String!, $num: Int!) {{
+      {__GRAPH_QL_RATE_LIMIT_STR}
+      user(login: $login) {{
+        pinnedItems(
+          {__GRAPH_QL_REPO_PIN_ITEMS_ARGS}
+        ) {{
+          {__GRAPH_QL_REPO_PIN_ITEMS_EDGES}
         }}
       }}
     }}
@@ -73,13 +85,19 @@ class GitHubApiClient:
       pageInfo { hasNextPage endCursor }
     """
     __GRAPH_QL_REPO_OWN_QUERY_STR: str = f"""
-    query ($login: String!, $num: Int!, $after: String, $field: RepositoryOrderField!) {{
+    query (
+      $login: String!
+      $num: Int!
+      $after: String
+      $field: RepositoryOrderField!
+      $direction: OrderDirection!
+    ) {{
       {__GRAPH_QL_RATE_LIMIT_STR}
       user(login: $login) {{
         repositories(
           first: $num
           after: $after
-          orderBy: {{ field: $field, direction: DESC }}
+          orderBy: {{ field: $field, direction: $direction }}
         ) {{
           {__GRAPH_QL_REPO_QUERY_PAGINATION}
           nodes {{
@@ -90,14 +108,20 @@ class GitHubApiClient:
     }}
     """
     __GRAPH_QL_REPO_CONTRIBUTED_QUERY_STR: str = f"""
-    query ($login: String!, $num: Int!, $after: String, $field: RepositoryOrderField!) {{
+    query (
+      $login: String!
+      $num: Int!
+      $after: String
+      $field: RepositoryOrderField!
+      $direction: OrderDirection!
+    ) {{
       {__GRAPH_QL_RATE_LIMIT_STR}
       user(login: $login) {{
         repositoriesContributedTo(
           first: $num
           after: $after
           contributionTypes: [COMMIT]
-          orderBy: {{ field: $field, direction: DESC }}
+          orderBy: {{ field: $field, direction: $direction }}
         ) {{
           {__GRAPH_QL_REPO_QUERY_PAGINATION}
           nodes {{
@@ -115,32 +139,89 @@ class GitHubApiClient:
       }}
     }}
     """
-    __GRAPH_QL_VERIFY_TOKEN_QUERY: str = f"""
-    query {{ 
-      {__GRAPH_QL_RATE_LIMIT_STR} 
-      viewer {{ login }} 
-    }}
-    """
-    __GRAPH_QL_USER_DATA_QUERY: str = f"""
-    query($login: String!) {{
-      {__GRAPH_QL_RATE_LIMIT_STR}
-      user(login: $login) {{
+    __GRAPH_QL_REPO_ALIAS_KEY: str = "r"
+    __GRAPH_QL_OWNER_VAR_KEY: str = "o"
+    __GRAPH_QL_NAME_VAR_KEY: str = "n"
+    __GRAPH_QL_NOT_FOUND_TYPE: str = "NOT_FOUND"
+    __GRAPH_QL_USER_DATA_STR: str = f"""
         login
         name
         databaseId
         createdAt
+        pinnedItems(
+          {__GRAPH_QL_REPO_PIN_ITEMS_ARGS}
+        ) @include(if: $isPinned) {{
+          {__GRAPH_QL_REPO_PIN_ITEMS_EDGES}
+        }}
+    """
+    # token verification, user config and (optionally) pinned repos in one round trip
+    __GRAPH_QL_VIEWER_BOOTSTRAP_QUERY: str = f"""
+    query ($num: Int!, $isPinned: Boolean!) {{
+      {__GRAPH_QL_RATE_LIMIT_STR}
+      viewer {{
+        {__GRAPH_QL_USER_DATA_STR}
+      }}
+    }}
+    """
+    __GRAPH_QL_USER_BOOTSTRAP_QUERY: str = f"""
+    query ($login: String!, $num: Int!, $isPinned: Boolean!) {{
+      {__GRAPH_QL_RATE_LIMIT_STR}
+      viewer {{ login }}
+      user(login: $login) {{
+        {__GRAPH_QL_USER_DATA_STR}
       }}
     }}
     """
     __DEFAULT_TIME_OUT: int = 10
     __DEFAULT_FETCH_LIMIT: int = 100
+    __DEFAULT_ORDER_FIELD: enums.RepositoryOrderFieldEnum = (
+        enums.RepositoryOrderFieldEnum.STARGAZERS
+    )
+    __DEFAULT_ALIAS_LIMIT: int = 50  # repository aliases per query (cost limit)
 
     __MAX_WORKERS: int = 8
 
+    __ETAG_HEADER: str = "ETag"
+    __IF_NONE_MATCH_HEADER: str = "If-None-Match"
+    __LAST_PAGE_KEY: str = "last"
+    __ETAG_CACHE_NAMESPACE: str = "etag"
+    __GRAPH_QL_CACHE_NAMESPACE: str = "graphql"
+
+    # response cache TTLs (seconds) per query type
+    __CACHE_TTL_PINNED: int = 30 * 60
+    __CACHE_TTL_OWNED_OR_CONTRIBUTED: int = 60 * 60
+    __CACHE_TTL_REPO_NAMES: int = 60 * 60
+
     def __init__(
-        self, api_token: str, username: str = None, fetch_limit: int = None
+        self,
+        api_token: str,
+        username: str = None,
+        fetch_limit: int = None,
+        transport: RepoPinsTransport = None,
+        is_prefetch_pinned: bool = False,
+        cache_dir: str = None,
+        is_cache_bypass: bool = False,
     ) -> None:
-        self.__local_thread: local = local()
+        self.__transport: RepoPinsTransport = (
+            transport if transport else RepoPinsTransport.shared()
+        )
+        # shared by GraphQL and REST requests, adapting to the remaining rate limit budget
+        self.__scheduler: GitHubApiScheduler = GitHubApiScheduler(
+            max_concurrency=self.__MAX_WORKERS
+        )
+        self.__etag_cache: RepoPinsCache = RepoPinsCache(
+            namespace=self.__ETAG_CACHE_NAMESPACE, cache_dir=cache_dir
+        )
+        self.__graph_ql_cache: RepoPinsCache = RepoPinsCache(
+            namespace=self.__GRAPH_QL_CACHE_NAMESPACE, cache_dir=cache_dir
+        )
+        self.__is_cache_bypass: bool = is_cache_bypass
+        self.__cache_hits: int = 0
+        self.__cache_cost_saved: int = 0
+        # responses are only shared between runs with the same token (private repo visibility)
+        self.__api_token_hash: str = sha256(
+            api_token.encode(encoding="utf-8")
+        ).hexdigest()
 
         self.__api_headers: dict[str, str] = {
             "Accept": "application/vnd.github+json",
@@ -154,10 +235,13 @@ class GitHubApiClient:
         )
         self.__fetch_cost_ttl: int = 0
         self.__fetch_cost_update_lock: Lock = Lock()
+        self.__prefetched_pinned_repos: list[dict] | None = None
 
         try:
             self.__gh_config_data: GitHubCredentialData = GitHubCredentialData(
-                *self.__verify_user(username=username)
+                *self.__verify_user(
+                    username=username, is_prefetch_pinned=is_prefetch_pinned
+                )
             )
         except AssertionError as err:
             raise GitHubGraphQlClientError(msg=f"API authorization error: {err}")
@@ -182,27 +266,69 @@ class GitHubApiClient:
             )}"
         )
 
+    @staticmethod
+    def __get_fetch_cost(res_json: dict = None) -> int:
+        return (
+            (
+                (res_json.get(enums.RepoPinsResDictKeys.DATA.value, {}) or {}).get(
+                    enums.RepoPinsResDictKeys.RATE_LIMIT.value, {}
+                )
+                or {}
+            ).get(enums.RepoPinsResDictKeys.COST.value, 0)
+            or 0
+            if res_json
+            else 1
+        )
+
     def __update_fetch_cost(self, res_json: dict = None) -> None:
         with self.__fetch_cost_update_lock:
-            self.__fetch_cost_ttl += (
-                (
-                    (res_json.get(enums.RepoPinsResDictKeys.DATA.value, {}) or {}).get(
-                        enums.RepoPinsResDictKeys.RATE_LIMIT.value, {}
-                    )
-                    or {}
-                ).get(enums.RepoPinsResDictKeys.COST.value, 0)
-                or 0
-                if res_json
-                else 1
+            self.__fetch_cost_ttl += self.__get_fetch_cost(res_json=res_json)
+
+    def __post_cached_request(
+        self, body_json: dict, cache_ttl: int
+    ) -> dict[str, str | list[str]] | None:
+        cache_key: str = sha256(
+            dumps(obj=[self.__api_token_hash, body_json], sort_keys=True).encode(
+                encoding="utf-8"
+            )
+        ).hexdigest()
+        if not self.__is_cache_bypass:
+            res_json: dict | None = self.__graph_ql_cache.get(
+                key=cache_key, ttl=cache_ttl
             )
+            if res_json is not None:
+                with self.__fetch_cost_update_lock:
+                    self.__cache_hits += 1
+                    self.__cache_cost_saved += self.__get_fetch_cost(res_json=res_json)
+                return res_json
+        res_json = self.__post_request(body_json=body_json)
+        if self.__is_cacheable_response(res_json=res_json):
+            self.__graph_ql_cache.set(key=cache_key, value=res_json)
+        return res_json
+
+    def __is_cacheable_response(self, res_json: dict | None) -> bool:
+        # transient errors are not served again, missing repos (NOT_FOUND) are stable
+        return (
+            isinstance(res_json, dict)
+            and res_json.get(enums.RepoPinsResDictKeys.DATA.value) is not None
+            and all(
+                isinstance(query_error, dict)
+                and query_error.get(enums.RepoPinsResDictKeys.TYPE.value)
+                == self.__GRAPH_QL_NOT_FOUND_TYPE
+                for query_error in res_json.get(enums.RepoPinsResDictKeys.ERRORS.value)
+                or []
+            )
+        )
 
     def __post_request(self, body_json: dict) -> dict[str, str | list[str]] | None:
         try:
-            res: Response = post(
-                self.__GRAPH_QL_URL,
-                headers=self.__api_headers,
-                json=body_json,
-                timeout=self.__DEFAULT_TIME_OUT,
+            res: Response = self.__scheduler.request(
+                send=lambda: self.__transport.post(
+                    url=self.__GRAPH_QL_URL,
+                    headers=self.__api_headers,
+                    json=body_json,
+                    time_out=self.__DEFAULT_TIME_OUT,
+                )
             )
             if res.status_code == HTTPStatus.OK:
                 res_json: dict[str, str | list[str]] = res.json()
@@ -234,102 +360,196 @@ class GitHubApiClient:
         except Exception as err:
             raise GitHubGraphQlClientError(msg=f"API request error: {err}")
 
-    def __get_user_config(self, username: str) -> tuple[str, int, str]:
-        res: dict[str, str | list[str]] = self.__post_request(
-            body_json={
-                "query": self.__GRAPH_QL_USER_DATA_QUERY,
-                "variables": {enums.RepoPinsResDictKeys.LOGIN.value: username},
-            }
-        )
-        return (
-            (
-                (res.get(enums.RepoPinsResDictKeys.DATA.value) or {}).get(
-                    enums.RepoPinsResDictKeys.USER.value
-                )
-                or {}
-            ).get(enums.RepoPinsResDictKeys.NAME.value, ""),
-            (
-                (res.get(enums.RepoPinsResDictKeys.DATA.value) or {}).get(
-                    enums.RepoPinsResDictKeys.USER.value
-                )
-                or {}
-            ).get(enums.RepoPinsResDictKeys.DB_ID.value, 0),
-            (
-                (res.get(enums.RepoPinsResDictKeys.DATA.value) or {}).get(
-                    enums.RepoPinsResDictKeys.USER.value
-                )
-                or {}
-            ).get(enums.RepoPinsResDictKeys.CREATED_AT.value, ""),
+    def __verify_user(
+        self, username: str = None, is_prefetch_pinned: bool = False
+    ) -> tuple[str, str, int, str]:
+        query_vars: dict[str, str | int | bool] = {
+            "num": self.__fetch_limit,
+            "isPinned": is_prefetch_pinned,
+        }
+        if username:
+            query_vars[enums.RepoPinsResDictKeys.LOGIN.value] = username
+        res_data: dict = (
+            self.__post_request(
+                body_json={
+                    "query": (
+                        self.__GRAPH_QL_USER_BOOTSTRAP_QUERY
+                        if username
+                        else self.__GRAPH_QL_VIEWER_BOOTSTRAP_QUERY
+                    ),
+                    "variables": query_vars,
+                }
+            ).get(enums.RepoPinsResDictKeys.DATA.value)
+            or {}
         )
-
-    def __verify_user(self, username: str = None) -> tuple[str, str, int, str]:
-        res: dict[str, str | list[str]] = self.__post_request(
-            body_json={"query": self.__GRAPH_QL_VERIFY_TOKEN_QUERY}
+        user_data: dict = (
+            res_data.get(
+                enums.RepoPinsResDictKeys.USER.value
+                if username
+                else enums.RepoPinsResDictKeys.VIEWER.value
+            )
+            or {}
         )
-        res_username: str = (
+        if is_prefetch_pinned:
+            self.__prefetched_pinned_repos = [
+                edge["node"]
+                for edge in (user_data.get("pinnedItems") or {}).get("edges", [])
+            ]
+        return (
             (
-                (res.get(enums.RepoPinsResDictKeys.DATA.value) or {}).get(
-                    enums.RepoPinsResDictKeys.VIEWER.value
-                )
-                or {}
-            )
-            .get(enums.RepoPinsResDictKeys.LOGIN.value, "")
-            .strip()
+                username
+                if username
+                else (
+                    user_data.get(enums.RepoPinsResDictKeys.LOGIN.value, "") or ""
+                ).strip()
+            ),
+            user_data.get(enums.RepoPinsResDictKeys.NAME.value, ""),
+            user_data.get(enums.RepoPinsResDictKeys.DB_ID.value, 0),
+            user_data.get(enums.RepoPinsResDictKeys.CREATED_AT.value, ""),
         )
-        if not username:
-            username = res_username
-        return (username, *self.__get_user_config(username=username))
 
     def __process_repo_req(
-        self, body_json: dict, repo_data_key: str, is_user_data: bool = True
+        self,
+        body_json: dict,
+        repo_data_key: str,
+        is_user_data: bool = True,
+        cache_ttl: int = None,
     ) -> dict:
         res_data: dict = (
-            self.__post_request(body_json=body_json).get(
-                enums.RepoPinsResDictKeys.DATA.value
-            )
-            or {}
-        )
+            self.__post_cached_request(body_json=body_json, cache_ttl=cache_ttl)
+            if cache_ttl
+            else self.__post_request(body_json=body_json)
+        ).get(enums.RepoPinsResDictKeys.DATA.value) or {}
         return (
             res_data.get(enums.RepoPinsResDictKeys.USER.value) or {}
             if is_user_data
             else res_data
         ).get(repo_data_key) or {}
 
-    def __paginate_fetch_repo_data(
-        self, body_json: dict, repo_data_key: str, pinned_repo_urls: list
-    ) -> list[dict[str, str | int | dict[str, str]]]:
-        res_node_data: list[dict[str, str | int | dict[str, str]]] = []
-        repo_urls: set[str] = set(pinned_repo_urls)
+    def __iter_repo_nodes(
+        self, body_json: dict, repo_data_key: str, cache_ttl: int = None
+    ) -> Iterator[dict[str, str | int | dict[str, str]]]:
         after: str | None = None
-
-        while True:
+        while True:  # next page is only requested when the consumer needs more nodes
             repo_data: dict = self.__process_repo_req(
                 body_json=(
                     body_json["variables"].update({"after": after}) or body_json
                 ),
                 repo_data_key=repo_data_key,
+                cache_ttl=cache_ttl,
             )
-            for node in repo_data.get("nodes", []):
-                if not node:
-                    continue
-                url: str = node.get(enums.RepoPinsResDictKeys.URL.value, "")
-                if url in repo_urls:
-                    continue
-                repo_urls.add(url)
-                res_node_data.append(node)
+            yield from (node for node in repo_data.get("nodes", []) if node)
 
             if not repo_data.get("pageInfo", {}).get("hasNextPage"):
-                break
+                return
             after = repo_data.get("pageInfo", {}).get("endCursor")
 
+    def __paginate_fetch_repo_data(
+        self,
+        body_json: dict,
+        repo_data_key: str,
+        pinned_repo_urls: list,
+        cache_ttl: int = None,
+        max_num_repos: int = None,
+    ) -> list[dict[str, str | int | dict[str, str]]]:
+        res_node_data: list[dict[str, str | int | dict[str, str]]] = []
+        repo_urls: set[str] = set(pinned_repo_urls)
+
+        for node in self.__iter_repo_nodes(
+            body_json=body_json, repo_data_key=repo_data_key, cache_ttl=cache_ttl
+        ):
+            url: str = node.get(enums.RepoPinsResDictKeys.URL.value, "")
+            if url in repo_urls:
+                continue
+            repo_urls.add(url)
+            res_node_data.append(node)
+            if max_num_repos and len(res_node_data) >= max_num_repos:
+                break  # server-ordered, so the remaining pages cannot rank higher
+
         return res_node_data
 
-    def __session(self) -> Session:
-        if not hasattr(self.__local_thread, Session.__name__.lower()):
-            thread_session: Session = Session()
-            thread_session.headers.update(self.__api_headers)
-            self.__local_thread.session = thread_session
-        return self.__local_thread.session
+    @staticmethod
+    def __get_last_page(res: Response) -> int | None:
+        last_page: list[str] = parse_qs(
+            qs=urlparse(url=(res.links.get("last") or {}).get("url", "")).query
+        ).get("page", [])
+        return int(last_page[0]) if last_page and last_page[0].isdigit() else None
+
+    def __fetch_repo_contribution_page(
+        self, query_str: str, per_page: int, page: int, is_anon: bool = False
+    ) -> tuple[list[dict[str, str | int]], int | None]:
+        etag_key: str = f"{query_str}?per_page={per_page}&page={page}" + (
+            "&anon=true" if is_anon else ""
+        )
+        etag_data: dict | None = self.__etag_cache.get(key=etag_key)
+        for i in range(self.__DEFAULT_TIME_OUT):
+            res: Response = self.__scheduler.request(
+                send=lambda: self.__transport.get(
+                    url=query_str,
+                    headers=(
+                        {
+                            **self.__api_headers,
+                            self.__IF_NONE_MATCH_HEADER: etag_data[self.__ETAG_HEADER],
+                        }
+                        if etag_data
+                        else self.__api_headers
+                    ),
+                    params={
+                        "per_page": per_page,
+                        "page": page,
+                        **({"anon": "true"} if is_anon else {}),
+                    },
+                    time_out=self.__DEFAULT_TIME_OUT,
+                )
+            )
+
+            if res.status_code == HTTPStatus.NOT_MODIFIED and etag_data:
+                # conditional requests answered 304 do not count against the rate limit
+                return (
+                    etag_data[enums.RepoPinsResDictKeys.DATA.value],
+                    etag_data.get(self.__LAST_PAGE_KEY),
+                )
+            self.__update_fetch_cost()
+            if res.status_code == HTTPStatus.OK:
+                res_data: list[dict[str, str | int]] = [
+                    {  # trimmed to the fields used for identity matching
+                        enums.RepoPinsResDictKeys.LOGIN.value: contributor.get(
+                            enums.RepoPinsResDictKeys.LOGIN.value
+                        ),
+                        enums.RepoPinsResDictKeys.CONTRIBUTIONS.value: contributor.get(
+                            enums.RepoPinsResDictKeys.CONTRIBUTIONS.value
+                        ),
+                        **(
+                            {  # anonymous contributors are commit identities only
+                                enums.RepoPinsResDictKeys.NAME.value: contributor.get(
+                                    enums.RepoPinsResDictKeys.NAME.value
+                                ),
+                                enums.RepoPinsResDictKeys.EMAIL.value: contributor.get(
+                                    enums.RepoPinsResDictKeys.EMAIL.value
+                                ),
+                            }
+                            if is_anon
+                            else {}
+                        ),
+                    }
+                    for contributor in res.json() or []
+                ]
+                last_page: int | None = self.__get_last_page(res=res)
+                if res.headers.get(self.__ETAG_HEADER):
+                    self.__etag_cache.set(
+                        key=etag_key,
+                        value={
+                            self.__ETAG_HEADER: res.headers.get(self.__ETAG_HEADER),
+                            enums.RepoPinsResDictKeys.DATA.value: res_data,
+                            self.__LAST_PAGE_KEY: last_page,
+                        },
+                    )
+                return res_data, last_page
+            if res.status_code == HTTPStatus.ACCEPTED:
+                sleep(min(2**i, 30))
+                continue
+            res.raise_for_status()
+        return [], None
 
     def __fetch_repo_contribution_data(
         self, repo_owner: str, repo_name: str
@@ -337,33 +557,14 @@ class GitHubApiClient:
         query_str: str = (
             f"https://api.github.com/repos/{repo_owner}/{repo_name}/contributors"
         )
-        session: Session = self.__session()
         contribution_data: list = []
         page: int = 1
 
         try:
             while True:
-                res_data: list = []
-                for i in range(self.__DEFAULT_TIME_OUT):
-                    res: Response = session.get(
-                        url=query_str,
-                        headers=self.__api_headers,
-                        params={
-                            "per_page": self.__DEFAULT_FETCH_LIMIT,
-                            "page": page,
-                        },
-                        timeout=self.__DEFAULT_TIME_OUT,
-                    )
-                    self.__update_fetch_cost()
-
-                    if res.status_code == HTTPStatus.OK:
-                        res_data.extend(res.json() or [])
-                        break
-                    if res.status_code == HTTPStatus.ACCEPTED:
-                        sleep(min(2**i, 30))
-                        continue
-                    res.raise_for_status()
-
+                res_data, _ = self.__fetch_repo_contribution_page(
+                    query_str=query_str, per_page=self.__DEFAULT_FETCH_LIMIT, page=page
+                )
                 if not res_data:
                     break
                 contribution_data.extend(res_data)
@@ -372,44 +573,207 @@ class GitHubApiClient:
             raise GitHubGraphQlClientError(msg=f"API request error: {str(err)}")
         return contribution_data
 
-    def __fetch_repos_contribution_data_parallel(self, repos: list[dict]) -> list[dict]:
-        raw_contribution_data: dict = {}
+    def __fetch_repo_contributor_count(self, repo_owner: str, repo_name: str) -> int:
+        query_str: str = (
+            f"https://api.github.com/repos/{repo_owner}/{repo_name}/contributors"
+        )
+        try:
+            # one contributor per page, so the last page number is the contributor count
+            res_data, last_page = self.__fetch_repo_contribution_page(
+                query_str=query_str, per_page=1, page=1
+            )
+        except Exception as err:
+            raise GitHubGraphQlClientError(msg=f"API request error: {str(err)}")
+        return last_page if last_page else len(res_data)
+
+    def __fetch_repo_sole_contributor(
+        self, repo_owner: str, repo_name: str
+    ) -> dict[str, str | int] | None:
+        query_str: str = (
+            f"https://api.github.com/repos/{repo_owner}/{repo_name}/contributors"
+        )
+        try:
+            # two per page, including commit identities without an account
+            res_data, _ = self.__fetch_repo_contribution_page(
+                query_str=query_str, per_page=2, page=1, is_anon=True
+            )
+        except (Timeout, ConnectionError, HTTPError, RequestException):
+            return None
+        return res_data[0] if len(res_data) == 1 else None
+
+    def __fetch_repo_contributor_weeks(
+        self, repo_owner: str, repo_name: str
+    ) -> list[dict[str, str | int | list]] | None:
+        query_str: str = (
+            f"https://api.github.com/repos/{repo_owner}/{repo_name}/stats/contributors"
+        )
+        etag_data: dict | None = self.__etag_cache.get(key=query_str)
+        res: Response = self.__scheduler.request(
+            send=lambda: self.__transport.get(
+                url=query_str,
+                headers=(
+                    {
+                        **self.__api_headers,
+                        self.__IF_NONE_MATCH_HEADER: etag_data[self.__ETAG_HEADER],
+                    }
+                    if etag_data
+                    else self.__api_headers
+                ),
+                time_out=self.__DEFAULT_TIME_OUT,
+            )
+        )
+
+        if res.status_code == HTTPStatus.NOT_MODIFIED and etag_data:
+            return etag_data[enums.RepoPinsResDictKeys.DATA.value]
+        self.__update_fetch_cost()
+        if res.status_code == HTTPStatus.ACCEPTED:
+            return None  # stats are being computed, the caller polls again later
+        if res.status_code == HTTPStatus.NO_CONTENT:
+            return []  # empty repo
+        res.raise_for_status()
+        res_data: list[dict[str, str | int | list]] = [
+            {  # trimmed to the author and their active weeks
+                enums.RepoPinsResDictKeys.LOGIN.value: (
+                    contributor.get(enums.RepoPinsResDictKeys.AUTHOR.value) or {}
+                ).get(enums.RepoPinsResDictKeys.LOGIN.value),
+                enums.RepoPinsResDictKeys.ID.value: (
+                    contributor.get(enums.RepoPinsResDictKeys.AUTHOR.value) or {}
+                ).get(enums.RepoPinsResDictKeys.ID.value),
+                enums.RepoPinsResDictKeys.WEEKS.value: [
+                    week
+                    for week in contributor.get(enums.RepoPinsResDictKeys.WEEKS.value)
+                    or []
+                    if week.get(enums.RepoPinsResDictKeys.WEEK_COMMITS.value)
+                ],
+            }
+            for contributor in res.json() or []
+        ]
+        if res.headers.get(self.__ETAG_HEADER):
+            self.__etag_cache.set(
+                key=query_str,
+                value={
+                    self.__ETAG_HEADER: res.headers.get(self.__ETAG_HEADER),
+                    enums.RepoPinsResDictKeys.DATA.value: res_data,
+                },
+            )
+        return res_data
+
+    def __set_repo_contribution_data(
+        self, repo: dict, is_count_only: bool = True
+    ) -> dict:
+        repo_owner: str = (
+            (repo.get(enums.RepoPinsResDictKeys.OWNER.value, {}) or {}).get(
+                enums.RepoPinsResDictKeys.LOGIN.value, ""
+            )
+            or ""
+        ).strip()
+        repo_name: str = (
+            repo.get(enums.RepoPinsResDictKeys.NAME.value, "") or ""
+        ).strip()
+        try:
+            if is_count_only:
+                repo[enums.RepoPinsResDictKeys.CONTRIBUTOR_COUNT.value] = (
+                    self.__fetch_repo_contributor_count(
+                        repo_owner=repo_owner, repo_name=repo_name
+                    )
+                )
+            else:
+                repo[enums.RepoPinsResDictKeys.CONTRIBUTION.value] = (
+                    self.__fetch_repo_contribution_data(
+                        repo_owner=repo_owner, repo_name=repo_name
+                    )
+                )
+        except (
+            GitHubGraphQlClientError,
+            Timeout,
+            ConnectionError,
+            HTTPError,
+            RequestException,
+        ):
+            repo[enums.RepoPinsResDictKeys.CONTRIBUTION.value] = []
+        return repo
+
+    def __fetch_repos_contribution_data_parallel(
+        self, repos: list[dict], is_count_only: bool = True
+    ) -> list[dict]:
         with ThreadPoolExecutor(
             max_workers=min(self.__MAX_WORKERS, max(1, len(repos)))
         ) as thread_pool:
-            for i, repo in enumerate(repos):
-                raw_contribution_data[
+            for repo_complete in as_completed(
+                fs=[
                     thread_pool.submit(
-                        self.__fetch_repo_contribution_data,
-                        (
-                            (
-                                repo.get(enums.RepoPinsResDictKeys.OWNER.value, {})
-                                or {}
-                            ).get(enums.RepoPinsResDictKeys.LOGIN.value, "")
-                            or ""
-                        ).strip(),
-                        (
-                            repo.get(enums.RepoPinsResDictKeys.NAME.value, "") or ""
-                        ).strip(),
+                        self.__set_repo_contribution_data, repo, is_count_only
                     )
-                ] = i
-
-            for i_complete in as_completed(fs=raw_contribution_data):
-                i = raw_contribution_data[i_complete]
-                try:
-                    repos[i][
-                        enums.RepoPinsResDictKeys.CONTRIBUTION.value
-                    ] = i_complete.result()
-                except (
-                    GitHubGraphQlClientError,
-                    Timeout,
-                    ConnectionError,
-                    HTTPError,
-                    RequestException,
-                ):
-                    repos[i][enums.RepoPinsResDictKeys.CONTRIBUTION.value] = []
+                    for repo in repos
+                ]
+            ):
+                repo_complete.result()
         return repos
 
+    def __build_repo_names_query(self, num_repos: int) -> str:
+        query_vars: str = ", ".join(
+            f"${self.__GRAPH_QL_OWNER_VAR_KEY}{i}: String!, ${self.__GRAPH_QL_NAME_VAR_KEY}{i}: String!"
+            for i in range(num_repos)
+        )
+        query_aliases: str = "".join(
+            f"""
+      {self.__GRAPH_QL_REPO_ALIAS_KEY}{i}: repository(
+        owner: ${self.__GRAPH_QL_OWNER_VAR_KEY}{i}, name: ${self.__GRAPH_QL_NAME_VAR_KEY}{i}
+      ) {{
+        {self.__GRAPH_QL_REPO_QUERY_NODE_DATA}
+      }}"""
+            for i in range(num_repos)
+        )
+        return f"""
+    query ({query_vars}) {{
+      {self.__GRAPH_QL_RATE_LIMIT_STR}
+      {query_aliases}
+    }}
+    """
+
+    def __fetch_repo_names_chunk(
+        self, owner_repos: list[tuple[str, str]]
+    ) -> list[dict[str, str | int | dict | list]]:
+        res_json: dict = (
+            self.__post_cached_request(
+                body_json={
+                    "query": self.__build_repo_names_query(num_repos=len(owner_repos)),
+                    "variables": {
+                        f"{var_key}{i}": var_val
+                        for i, (owner, name) in enumerate(owner_repos)
+                        for var_key, var_val in (
+                            (self.__GRAPH_QL_OWNER_VAR_KEY, owner),
+                            (self.__GRAPH_QL_NAME_VAR_KEY, name),
+                        )
+                    },
+                },
+                cache_ttl=self.__CACHE_TTL_REPO_NAMES,
+            )
+            or {}
+        )
+        res_data: dict = res_json.get(enums.RepoPinsResDictKeys.DATA.value) or {}
+        # a missing repo is a NOT_FOUND error on its own alias, which maps to {}
+        query_errors: list[dict] = [
+            query_error
+            for query_error in res_json.get(enums.RepoPinsResDictKeys.ERRORS.value)
+            or []
+            if not isinstance(query_error, dict)
+            or query_error.get(enums.RepoPinsResDictKeys.TYPE.value)
+            != self.__GRAPH_QL_NOT_FOUND_TYPE
+        ]
+        if query_errors and not res_data:
+            raise GitHubGraphQlClientError(
+                msg=f"API request error: {
+                    query_errors[0].get(enums.RepoPinsResDictKeys.MESSAGE.value)
+                    if isinstance(query_errors[0], dict)
+                    else query_errors[0]
+                }"
+            )
+        return [
+            res_data.get(f"{self.__GRAPH_QL_REPO_ALIAS_KEY}{i}") or {}
+            for i in range(len(owner_repos))
+        ]
+
     @property
     def user_id(self) -> int | None:
         return self.__gh_config_data.user_id
@@ -426,9 +790,27 @@ class GitHubApiClient:
     def fetch_cost(self) -> int:
         return self.__fetch_cost_ttl
 
+    @property
+    def cache_hits(self) -> int:
+        return self.__cache_hits
+
+    @property
+    def cache_cost_saved(self) -> int:
+        return self.__cache_cost_saved
+
+    @property
+    def alias_limit(self) -> int:
+        return self.__DEFAULT_ALIAS_LIMIT
+
     def fetch_pinned_repo_data(
         self, num_repos: int = None
     ) -> list[dict[str, str | int | dict | list]]:
+        if self.__prefetched_pinned_repos is not None and (
+            not num_repos or num_repos == self.__fetch_limit
+        ):  # fetched with the client bootstrap query
+            pinned_repo_data: list[dict] = self.__prefetched_pinned_repos
+            self.__prefetched_pinned_repos = None
+            return pinned_repo_data
         pinned_repos: dict = self.__process_repo_req(
             body_json={
                 "query": self.__GRAPH_QL_REPO_PIN_QUERY_STR,
@@ -438,6 +820,7 @@ class GitHubApiClient:
                 },
             },
             repo_data_key="pinnedItems",
+            cache_ttl=self.__CACHE_TTL_PINNED,
         )
         return [edge["node"] for edge in pinned_repos.get("edges", [])]
 
@@ -446,7 +829,10 @@ class GitHubApiClient:
         order_field: enums.RepositoryOrderFieldEnum = None,
         pinned_repo_urls: list[str] = None,
         is_contributed: bool = False,
+        max_num_repos: int = None,
     ) -> list[dict[str, str | int | dict | list]]:
+        order_field = order_field if order_field else self.__DEFAULT_ORDER_FIELD
+        pinned_repo_urls = pinned_repo_urls if pinned_repo_urls else []
         return self.__paginate_fetch_repo_data(
             body_json={
                 "query": (
@@ -456,18 +842,25 @@ class GitHubApiClient:
                 ),
                 "variables": {
                     enums.RepoPinsResDictKeys.LOGIN.value: self.__gh_config_data.username,
-                    "num": self.__fetch_limit,
-                    "field": (
-                        order_field.name
-                        if order_field
-                        else enums.RepositoryOrderFieldEnum.STARGAZERS.name
-                    ).upper(),
+                    "num": (
+                        min(self.__fetch_limit, max_num_repos + len(pinned_repo_urls))
+                        if max_num_repos
+                        else self.__fetch_limit
+                    ),
+                    "field": order_field.name.upper(),
+                    "direction": (  # matches the ordering of repo pins by preference
+                        "ASC"
+                        if order_field is enums.RepositoryOrderFieldEnum.NAME
+                        else "DESC"
+                    ),
                 },
             },
             repo_data_key=(
                 "repositoriesContributedTo" if is_contributed else "repositories"
             ),
-            pinned_repo_urls=pinned_repo_urls if pinned_repo_urls else [],
+            pinned_repo_urls=pinned_repo_urls,
+            cache_ttl=self.__CACHE_TTL_OWNED_OR_CONTRIBUTED,
+            max_num_repos=max_num_repos,
         )
 
     def fetch_single_repo_data(
@@ -486,7 +879,47 @@ class GitHubApiClient:
             },
             repo_data_key="repository",
             is_user_data=False,
+            cache_ttl=self.__CACHE_TTL_REPO_NAMES,
         )
 
-    def fetch_contributor_stats(self, repo_list: list[dict]) -> list[dict]:
-        return self.__fetch_repos_contribution_data_parallel(repos=repo_list)
+    def fetch_multiple_repo_data(
+        self, owner_repos: list[str]
+    ) -> list[dict[str, str | int | dict | list]]:
+        repo_names: list[tuple[str, str]] = [
+            (owner.strip(), name.strip())
+            for owner, name in (owner_repo.split("/") for owner_repo in owner_repos)
+        ]
+        repo_data: list[dict[str, str | int | dict | list]] = []
+        for i in range(0, len(repo_names), self.__DEFAULT_ALIAS_LIMIT):
+            repo_data.extend(
+                self.__fetch_repo_names_chunk(
+                    owner_repos=repo_names[i : i + self.__DEFAULT_ALIAS_LIMIT]
+                )
+            )
+        return repo_data
+
+    def fetch_repo_contributor_stats(
+        self, repo: dict, is_count_only: bool = True
+    ) -> dict:
+        return self.__set_repo_contribution_data(repo=repo, is_count_only=is_count_only)
+
+    def fetch_repo_sole_contributor(
+        self, repo_owner: str, repo_name: str
+    ) -> dict[str, str | int] | None:
+        return self.__fetch_repo_sole_contributor(
+            repo_owner=repo_owner, repo_name=repo_name
+        )
+
+    def fetch_repo_contributor_weeks(
+        self, repo_owner: str, repo_name: str
+    ) -> list[dict[str, str | int | list]] | None:
+        return self.__fetch_repo_contributor_weeks(
+            repo_owner=repo_owner, repo_name=repo_name
+        )
+
+    def fetch_contributor_stats(
+        self, repo_list: list[dict], is_count_only: bool = True
+    ) -> list[dict]:
+        return self.__fetch_repos_contribution_data_parallel(
+            repos=repo_list, is_count_only=is_count_only
+        )
@@ -0,0 +1,78 @@
+from gh_profile_repo_pins.repo_pins_data.repo_pins_api import GitHubApiClient
+import gh_profile_repo_pins.repo_pins_enum as enums
+from asyncio import Semaphore, gather, to_thread
+from typing import Any, Callable
+
+
+class GitHubApiAsyncClient:
+
+    __DEFAULT_MAX_CONCURRENCY: int = 8
+
+    def __init__(
+        self, gh_api_client: GitHubApiClient, max_concurrency: int = None
+    ) -> None:
+        self.__gh_api_client: GitHubApiClient = gh_api_client
+        # global limit of in-flight requests across all fetches on the event loop
+        self.__semaphore: Semaphore = Semaphore(
+            value=max_concurrency if max_concurrency else self.__DEFAULT_MAX_CONCURRENCY
+        )
+
+    async def __run(self, fetch: Callable, **kwargs) -> Any:
+        async with self.__semaphore:
+            return await to_thread(fetch, **kwargs)
+
+    async def fetch_pinned_repo_data(
+        self, num_repos: int = None
+    ) -> list[dict[str, str | int | dict | list]]:
+        return await self.__run(
+            fetch=self.__gh_api_client.fetch_pinned_repo_data, num_repos=num_repos
+        )
+
+    async def fetch_owned_or_contributed_to_repo_data(
+        self,
+        order_field: enums.RepositoryOrderFieldEnum = None,
+        pinned_repo_urls: list[str] = None,
+        is_contributed: bool = False,
+        max_num_repos: int = None,
+    ) -> list[dict[str, str | int | dict | list]]:
+        # cursor pagination is sequential within a stream, holding one request slot at a time
+        return await self.__run(
+            fetch=self.__gh_api_client.fetch_owned_or_contributed_to_repo_data,
+            order_field=order_field,
+            pinned_repo_urls=pinned_repo_urls,
+            is_contributed=is_contributed,
+            max_num_repos=max_num_repos,
+        )
+
+    async def fetch_multiple_repo_data(
+        self, owner_repos: list[str]
+    ) -> list[dict[str, str | int | dict | list]]:
+        alias_limit: int = self.__gh_api_client.alias_limit
+        return [
+            repo_data
+            for repo_data_chunk in await gather(
+                *[
+                    self.__run(
+                        fetch=self.__gh_api_client.fetch_multiple_repo_data,
+                        owner_repos=owner_repos[i : i + alias_limit],
+                    )
+                    for i in range(0, len(owner_repos), alias_limit)
+                ]
+            )
+            for repo_data in repo_data_chunk
+        ]
+
+    async def fetch_contributor_stats(
+        self, repo_list: list[dict], is_count_only: bool = True
+    ) -> list[dict]:
+        await gather(
+            *[
+                self.__run(
+                    fetch=self.__gh_api_client.fetch_repo_contributor_stats,
+                    repo=repo,
+                    is_count_only=is_count_only,
+                )
+                for repo in repo_list
+            ]
+        )
+        return repo_list
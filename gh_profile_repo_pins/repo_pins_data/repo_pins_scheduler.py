@@ -0,0 +1,159 @@
+from requests import Response, Timeout, ConnectionError
+from gh_profile_repo_pins.utils import get_logger, Logger
+from threading import Condition
+from http import HTTPStatus
+from typing import Callable
+from random import uniform
+from math import ceil
+from time import time
+
+
+class GitHubApiScheduler:
+
+    __DEFAULT_MAX_CONCURRENCY: int = 8
+    __DEFAULT_MAX_RETRIES: int = 5
+    # seconds, longer rate limit waits fail instead of stalling the run,
+    # one jittered secondary rate limit wait still fits
+    __DEFAULT_MAX_WAIT: int = 120
+    __BACKOFF_BASE: float = 1.0
+    __BACKOFF_CAP: float = 30.0
+    # GitHub asks to wait at least a minute, growing exponentially, on secondary limits
+    __SECONDARY_LIMIT_WAIT: float = 60.0
+    __SECONDARY_LIMIT_MSG: str = "secondary rate limit"
+    __HEADROOM_THRESHOLD: float = 0.2  # concurrency scales down below this budget ratio
+
+    __LIMIT_HEADER: str = "x-ratelimit-limit"
+    __REMAINING_HEADER: str = "x-ratelimit-remaining"
+    __RESET_HEADER: str = "x-ratelimit-reset"
+    __RESOURCE_HEADER: str = "x-ratelimit-resource"
+    __RETRY_AFTER_HEADER: str = "Retry-After"
+
+    __RATE_LIMIT_STATUS: set[int] = {HTTPStatus.FORBIDDEN, HTTPStatus.TOO_MANY_REQUESTS}
+    __RETRY_STATUS: set[int] = {
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        max_retries: int = None,
+        max_wait: int = None,
+    ) -> None:
+        self.__log: Logger = get_logger()
+        self.__max_concurrency: int = (
+            max_concurrency if max_concurrency else self.__DEFAULT_MAX_CONCURRENCY
+        )
+        self.__max_retries: int = (
+            max_retries if max_retries is not None else self.__DEFAULT_MAX_RETRIES
+        )
+        self.__max_wait: int = max_wait if max_wait else self.__DEFAULT_MAX_WAIT
+
+        self.__condition: Condition = Condition()
+        self.__active: int = 0
+        self.__blocked_until: float = 0.0
+        # per resource (graphql, core, ...): (remaining, limit, reset epoch seconds)
+        self.__budgets: dict[str, tuple[int, int, float]] = {}
+
+    def __get_concurrency(self) -> int:
+        headroom: float = min(
+            (
+                remaining / limit if limit else 1.0
+                for remaining, limit, reset_at in self.__budgets.values()
+                if reset_at > time()
+            ),
+            default=1.0,
+        )
+        if headroom >= self.__HEADROOM_THRESHOLD:
+            return self.__max_concurrency
+        return max(
+            1, ceil(self.__max_concurrency * headroom / self.__HEADROOM_THRESHOLD)
+        )
+
+    def __acquire(self) -> None:
+        with self.__condition:
+            while True:
+                wait: float = self.__blocked_until - time()
+                if wait <= 0 and self.__active < self.__get_concurrency():
+                    self.__active += 1
+                    return
+                self.__condition.wait(timeout=wait if wait > 0 else None)
+
+    def __release(self) -> None:
+        with self.__condition:
+            self.__active -= 1
+            self.__condition.notify_all()
+
+    def __block(self, delay: float) -> None:
+        with self.__condition:
+            self.__blocked_until = max(self.__blocked_until, time() + delay)
+            self.__condition.notify_all()
+
+    def __update_budget(self, res: Response) -> None:
+        try:
+            remaining: int = int(res.headers[self.__REMAINING_HEADER])
+            limit: int = int(res.headers.get(self.__LIMIT_HEADER, 0))
+            reset_at: float = float(res.headers.get(self.__RESET_HEADER, 0))
+        except (KeyError, ValueError):
+            return
+        with self.__condition:
+            self.__budgets[res.headers.get(self.__RESOURCE_HEADER, "")] = (
+                remaining,
+                limit,
+                reset_at,
+            )
+            self.__condition.notify_all()
+
+    def __get_backoff(self, attempt: int) -> float:
+        # full jitter, so parallel workers do not retry in lockstep
+        return uniform(0, min(self.__BACKOFF_CAP, self.__BACKOFF_BASE * 2**attempt))
+
+    def __get_rate_limit_delay(self, res: Response, attempt: int) -> float | None:
+        if res.status_code not in self.__RATE_LIMIT_STATUS:
+            return None
+        if res.headers.get(self.__RETRY_AFTER_HEADER, "").isdigit():
+            return float(res.headers.get(self.__RETRY_AFTER_HEADER))
+        if res.headers.get(self.__REMAINING_HEADER) == "0":
+            return max(
+                0.0, float(res.headers.get(self.__RESET_HEADER, 0) or 0) - time()
+            ) + self.__get_backoff(attempt=0)
+        if self.__SECONDARY_LIMIT_MSG in res.text.lower():
+            return self.__SECONDARY_LIMIT_WAIT * 2**attempt + self.__get_backoff(
+                attempt=attempt
+            )
+        if res.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            return self.__get_backoff(attempt=attempt)
+        return None  # forbidden for other reasons, such as bad credentials
+
+    @property
+    def concurrency(self) -> int:
+        with self.__condition:
+            return self.__get_concurrency()
+
+    def request(self, send: Callable[[], Response]) -> Response:
+        for attempt in range(self.__max_retries + 1):
+            self.__acquire()
+            try:
+                res: Response = send()
+            except (Timeout, ConnectionError):
+                if attempt == self.__max_retries:
+                    raise
+                self.__block(delay=self.__get_backoff(attempt=attempt))
+                continue
+            finally:
+                self.__release()
+            self.__update_budget(res=res)
+
+            delay: float | None = self.__get_rate_limit_delay(res=res, attempt=attempt)
+            if delay is None and res.status_code in self.__RETRY_STATUS:
+                delay = self.__get_backoff(attempt=attempt)
+            if delay is None:
+                return res
+            if attempt == self.__max_retries or delay > self.__max_wait:
+                return res  # the caller surfaces the error response
+            self.__log.warning(
+                msg=f"API rate limited ({res.status_code}), retrying in {delay:.1f}s"
+            )
+            self.__block(delay=delay)
+        return res
@@ -1,40 +1,217 @@
 from gh_profile_repo_pins.repo_pins_exceptions import RepoPinStatsError
-from subprocess import run, PIPE, CompletedProcess, CalledProcessError
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from gh_profile_repo_pins.repo_pins_data.repo_pins_stats_index import RepoPinStatsIndex
+from gh_profile_repo_pins.repo_pins_data.repo_pins_api import GitHubApiClient
+from gh_profile_repo_pins.repo_pins_cache import RepoPinsCache
+from gh_profile_repo_pins.utils import MIRROR_CACHE_DIR, get_logger, Logger
+from subprocess import (
+    run,
+    Popen,
+    PIPE,
+    CompletedProcess,
+    CalledProcessError,
+    TimeoutExpired,
+)
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    Future,
+    as_completed,
+    wait,
+    FIRST_COMPLETED,
+)
+from requests import RequestException
+from heapq import heappush, heappop
 import gh_profile_repo_pins.repo_pins_enum as enums
-from re import compile, I, Pattern
-from tempfile import mkdtemp
+from re import compile, Pattern
+from tempfile import mkdtemp, TemporaryFile
+from time import monotonic
+from datetime import datetime, date, UTC
+from calendar import monthrange
+from base64 import b64encode
+from functools import partial
+from typing import Iterator
+from threading import Lock, Condition, Timer
 from shutil import rmtree
-from os import environ
+from os import environ, utime, cpu_count
+from pathlib import Path
 
 
 class RepoPinStats:
 
     __TMP_DIR: str = "tmp_git"
     __IS_CALLED_PROCESS_ERR: bool = True
-    __MAX_WORKERS: int = 8
+    # clones are network bound and adapt to observed throughput, parsing is cpu bound
+    __DEFAULT_CLONE_WORKERS: int = 4
+    __MAX_CLONE_WORKERS: int = 8
+    __MIN_THROUGHPUT_SAMPLE: int = 1024 * 1024  # bytes, smaller fetches are too noisy
+    __MIRROR_DIR: str = "git"  # under a given cache dir
+    __MIRROR_EXT: str = ".git"
+    __ALTERNATES_FILE: str = "objects/info/alternates"
+    __DEFAULT_MIRROR_MAX_SIZE: int = 2 * 1024 * 1024 * 1024  # bytes
+    # seconds per repo, a repo over budget gets fallback or partial stats
+    __DEFAULT_CLONE_TIME_OUT: int = 300
+    __DEFAULT_LOG_TIME_OUT: int = 120
+    __MIN_TIME_OUT: float = 0.1
+    __SHALLOW_FILE: str = "shallow"
+    __EMPTY_SHALLOW_ERR: str = "no commits selected for shallow requests"
 
-    __AUTHOR_LABEL: str = "@@AUTHOR@@"
-    __CO_AUTHOR_LABEL: str = "Co-authored-by:"
-    __EMAIL_OPEN_BRACKET: str = " <"
+    __CHECKPOINT_NAMESPACE: str = "stats"
+    __CHECKPOINT_VERSION: int = 6  # bump when the parsed stats change meaning
+    # the stats are the history of these commits, HEAD or a partially parsed log
+    __CHECKPOINT_SHAS: str = "shas"
+    __CHECKPOINT_ADD: str = "add"
+    __CHECKPOINT_DEL: str = "del"
+    __CHECKPOINT_IDS: str = "ids"
+    # the resolved excludes, a changed .gitattributes restarts the count
+    __CHECKPOINT_PATHSPECS: str = "pathspecs"
+    # finished stats by owner/repo@sha, independent of the user viewing them
+    __RESULT_NAMESPACE: str = "stats_results"
+    __LS_REMOTE_TIME_OUT: int = 30
 
-    __AUTHOR_REG: Pattern = compile(
-        pattern=r"^{}\s+(.+?)\s*<([^>]+)>\s*$".format(__AUTHOR_LABEL)
+    __CHUNK_SIZE: int = 64 * 1024  # bytes
+    # one record per commit: sha, parents, author, email and co-author trailers,
+    # then -z numstat
+    __RECORD_SEP: bytes = b"\x1e"
+    __FIELD_SEP: str = "\x1f"
+    __NUMSTAT_SEP: bytes = b"\x00"
+    __GIT_LOG_FORMAT: str = (
+        "%x1e%H%x1f%P%x1f%aN%x1f%aE%x1f"
+        "%(trailers:key=Co-authored-by,valueonly,separator=%x1f)"
     )
-    __CO_AUTHOR_REG: Pattern = compile(
-        pattern=r"^\s*{}\s*(.+?)\s*<([^>]+)>\s*$".format(__CO_AUTHOR_LABEL), flags=I
-    )
-    __NUMSTAT_REG: Pattern = compile(pattern=r"^\d+\t\d+\t")
+    __IDENTITY_REG: Pattern = compile(pattern=r"^\s*(.+?)\s*<([^>]*)>\s*$")
+    __BINARY_NUMSTAT: bytes = b"-"  # binary files have no line counts
+    __NO_REPLY_EMAIL_DOMAIN: str = "@users.noreply.github.com"
+
+    # statistics API backend, repos still being computed (202) are polled with backoff
+    __API_POLL_TIME_OUT: int = 120  # seconds, then a repo gets partial stats
+    __API_POLL_BASE: float = 1.0
+    __API_POLL_CAP: float = 16.0
+    __API_WORKERS: int = 8
+    __WEEK_SECONDS: int = 7 * 24 * 60 * 60
+    __GHOST_LOGIN: str = "ghost"  # weeks of authors without an account
 
-    def __init__(self, gh_token: str = None) -> None:
+    __GITATTRIBUTES_REV: str = "HEAD:.gitattributes"
+    __EXCLUDE_ATTRS: set[str] = {
+        "linguist-generated",
+        "linguist-generated=true",
+        "linguist-vendored",
+        "linguist-vendored=true",
+    }
+
+    def __init__(
+        self,
+        gh_token: str = None,
+        cache_dir: str = None,
+        mirror_max_size: int = None,
+        is_mirror: bool = False,
+        is_cache_bypass: bool = False,
+        is_detect_renames: bool = True,
+        exclude_paths: list[str] = None,
+        stats_metric: enums.RepoPinStatsMetricEnum = None,
+        clone_time_out: int = None,
+        log_time_out: int = None,
+        stats_window: int = None,
+        gh_api_client: GitHubApiClient = None,
+        stats_backend: enums.RepoPinStatsBackendEnum = None,
+    ) -> None:
+        self.__log: Logger = get_logger()
         self.__gh_token: str = gh_token
+        # login user identity, for repos answered without cloning
+        self.__gh_api_client: GitHubApiClient | None = gh_api_client
+        # the statistics API needs no git binary or disk, but an API client
+        self.__stats_backend: enums.RepoPinStatsBackendEnum = (
+            stats_backend
+            if stats_backend and gh_api_client
+            else enums.RepoPinStatsBackendEnum.GIT
+        )
+        # opt-in, as mirrors persisted between workflow runs are uploaded to the actions cache
+        self.__mirror_dir: Path | None = (
+            (
+                Path(cache_dir).joinpath(self.__MIRROR_DIR)
+                if cache_dir
+                else Path(MIRROR_CACHE_DIR)
+            )
+            if is_mirror
+            else None
+        )
+        # private repos are never mirrored, only cloned for the run
+        self.__private_repos: set[str] = set()
+        self.__mirror_max_size: int = (
+            mirror_max_size if mirror_max_size else self.__DEFAULT_MIRROR_MAX_SIZE
+        )
+        self.__mirrors_in_use: set[Path] = set()
+        self.__mirror_lock: Lock = Lock()
+        # parents of forks in the current run, their clones are borrowed from
+        self.__reference_repos: set[str] = set()
 
-    def __get_completed_process(self, args: list[str]) -> CompletedProcess[str]:
+        self.__clone_condition: Condition = Condition()
+        self.__clone_active: int = 0
+        self.__clone_concurrency: int = self.__DEFAULT_CLONE_WORKERS
+        self.__clone_max_throughput: float = 0.0  # best bytes per second of one clone
+        self.__checkpoint_cache: RepoPinsCache = RepoPinsCache(
+            namespace=self.__CHECKPOINT_NAMESPACE, cache_dir=cache_dir
+        )
+        self.__result_cache: RepoPinsCache = RepoPinsCache(
+            namespace=self.__RESULT_NAMESPACE, cache_dir=cache_dir
+        )
+        self.__is_cache_bypass: bool = is_cache_bypass
+
+        # diff cost controls, rename detection dominates git log cpu time on large repos
+        self.__is_detect_renames: bool = is_detect_renames
+        # gitattributes style patterns, defaults to each repo's generated and vendored paths
+        self.__exclude_paths: list[str] | None = exclude_paths
+        self.__stats_metric: enums.RepoPinStatsMetricEnum = (
+            stats_metric if stats_metric else enums.RepoPinStatsMetricEnum.LINES
+        )
+        self.__clone_time_out: int = (
+            clone_time_out if clone_time_out else self.__DEFAULT_CLONE_TIME_OUT
+        )
+        self.__log_time_out: int = (
+            log_time_out if log_time_out else self.__DEFAULT_LOG_TIME_OUT
+        )
+        # months of history counted, fixed for the run so clones and logs agree
+        self.__since_date: date | None = (
+            self.__get_since_date(num_months=stats_window) if stats_window else None
+        )
+
+    @staticmethod
+    def __get_since_date(num_months: int) -> date:
+        today: date = datetime.now(tz=UTC).date()
+        month_index: int = today.year * 12 + today.month - 1 - num_months
+        since_year, since_month = month_index // 12, month_index % 12 + 1
+        return date(
+            year=since_year,
+            month=since_month,
+            day=min(today.day, monthrange(since_year, since_month)[1]),
+        )
+
+    def __get_since_args(self, arg_name: str) -> list[str]:
+        return (
+            [f"--{arg_name}={self.__since_date.isoformat()}T00:00:00Z"]
+            if self.__since_date
+            else []
+        )
+
+    def __get_git_env(self) -> dict[str, str]:
         env = environ.copy()
         env.setdefault("GIT_TERMINAL_PROMPT", "0")
         env.setdefault("GIT_OPTIONAL_LOCKS", "0")
         env.setdefault("GIT_ASKPASS", "true")
         env.setdefault("GIT_PAGER", "cat")
+        if self.__gh_token:
+            # auth header via env config, so the token is never written to a mirror's config
+            env["GIT_CONFIG_COUNT"] = "1"
+            env["GIT_CONFIG_KEY_0"] = "http.https://github.com/.extraHeader"
+            env["GIT_CONFIG_VALUE_0"] = "Authorization: Basic {}".format(
+                b64encode(f"x-access-token:{self.__gh_token}".encode()).decode()
+            )
+        return env
+
+    def __get_time_out(self, deadline: float | None) -> float | None:
+        return max(deadline - monotonic(), self.__MIN_TIME_OUT) if deadline else None
+
+    def __get_completed_process(
+        self, args: list[str], deadline: float = None
+    ) -> CompletedProcess[str]:
         return run(
             args=args,
             check=self.__IS_CALLED_PROCESS_ERR,
@@ -43,144 +220,844 @@ class RepoPinStats:
             text=True,
             encoding="utf-8",
             errors="ignore",
-            env=env,
+            env=self.__get_git_env(),
+            timeout=self.__get_time_out(deadline=deadline),
         )
 
-    def __fetch_git_commit_data(
-        self, url: str, tmp_dir: str
-    ) -> CompletedProcess[str] | None:
-        self.__get_completed_process(
+    def __stream_process(
+        self, args: list[str], deadline: float = None
+    ) -> Iterator[bytes]:
+        # stderr is spooled to a file, a full stderr pipe would block the stdout reader
+        with (
+            TemporaryFile() as stderr_file,
+            Popen(
+                args=args, stdout=PIPE, stderr=stderr_file, env=self.__get_git_env()
+            ) as process,
+        ):
+            # killed at the deadline, as a stalled git blocks the pipe read indefinitely
+            time_out: float | None = self.__get_time_out(deadline=deadline)
+            watchdog: Timer | None = (
+                Timer(interval=time_out, function=process.kill) if time_out else None
+            )
+            if watchdog:
+                watchdog.daemon = True
+                watchdog.start()
+            try:
+                yield from iter(partial(process.stdout.read1, self.__CHUNK_SIZE), b"")
+            finally:
+                if watchdog:
+                    watchdog.cancel()
+            if process.wait() and deadline and monotonic() >= deadline:
+                raise TimeoutExpired(cmd=args, timeout=time_out)
+            if process.returncode and self.__IS_CALLED_PROCESS_ERR:
+                stderr_file.seek(0)
+                raise CalledProcessError(
+                    returncode=process.returncode,
+                    cmd=args,
+                    output="",
+                    stderr=stderr_file.read().decode(encoding="utf-8", errors="ignore"),
+                )
+
+    def __clone_repo(
+        self,
+        url: str,
+        repo_dir: str,
+        is_bare: bool = False,
+        deadline: float = None,
+        reference_dir: str = None,
+    ) -> None:
+        # objects already in a reference (parent) clone are not downloaded again,
+        # temp clones copy them in, as the reference is removed independently
+        self.__get_shallow_process(
             args=[
                 "git",
                 "clone",
+                *(["--bare"] if is_bare else []),
                 "--no-tags",
                 "--single-branch",
+                *(["--reference-if-able", reference_dir] if reference_dir else []),
+                *(["--dissociate"] if reference_dir and not is_bare else []),
                 url,
-                tmp_dir,
-            ]
+                repo_dir,
+            ],
+            deadline=deadline,
+        )
+        self.__deepen_shallow_repo(url=url, repo_dir=repo_dir, deadline=deadline)
+
+    def __get_shallow_process(self, args: list[str], deadline: float = None) -> None:
+        try:
+            self.__get_completed_process(
+                args=[*args, *self.__get_since_args(arg_name="shallow-since")],
+                deadline=deadline,
+            )
+        except CalledProcessError as err:
+            if not self.__since_date or self.__EMPTY_SHALLOW_ERR not in (
+                err.stderr or ""
+            ):
+                raise
+            # no commits in the window, only the head commit is kept and none are counted
+            self.__get_completed_process(args=[*args, "--depth=1"], deadline=deadline)
+
+    def __is_shallow_repo(self, repo_dir: str, is_bare: bool = True) -> bool:
+        return (
+            Path(repo_dir)
+            .joinpath(*([] if is_bare else [".git"]), self.__SHALLOW_FILE)
+            .exists()
+        )
+
+    def __deepen_shallow_repo(
+        self, url: str, repo_dir: str, deadline: float = None
+    ) -> None:
+        # shallow boundary commits diff as if every file was added,
+        # so their parents are fetched and left outside of the window instead
+        if self.__is_shallow_repo(repo_dir=repo_dir) or self.__is_shallow_repo(
+            repo_dir=repo_dir, is_bare=False
+        ):
+            self.__get_completed_process(
+                args=[
+                    "git",
+                    "-C",
+                    repo_dir,
+                    "fetch",
+                    "--no-tags",
+                    "--deepen=1",
+                    url,
+                    "HEAD",
+                ],
+                deadline=deadline,
+            )
+
+    def __update_mirror(
+        self,
+        url: str,
+        owner_repo: str,
+        deadline: float = None,
+        reference_dir: str = None,
+    ) -> str:
+        mirror_path: Path = self.__mirror_dir.joinpath(
+            owner_repo.lower() + self.__MIRROR_EXT
         )
+        with self.__mirror_lock:
+            self.__mirrors_in_use.add(mirror_path)
+
+        if mirror_path.joinpath("HEAD").exists():
+            try:
+                # bare clones have no fetch refspec, so the default branch is updated explicitly
+                head_ref: str = self.__get_completed_process(
+                    args=["git", "-C", str(mirror_path), "symbolic-ref", "HEAD"],
+                    deadline=deadline,
+                ).stdout.strip()
+                # a shallow mirror follows the window, or is completed without one
+                is_shallow: bool = self.__is_shallow_repo(repo_dir=str(mirror_path))
+                fetch_args: list[str] = [
+                    "git",
+                    "-C",
+                    str(mirror_path),
+                    "fetch",
+                    "--no-tags",
+                    "--prune",
+                    url,
+                    f"+{head_ref}:{head_ref}",
+                ]
+                if is_shallow and self.__since_date:
+                    self.__get_shallow_process(args=fetch_args, deadline=deadline)
+                else:
+                    self.__get_completed_process(
+                        args=[*fetch_args, *(["--unshallow"] if is_shallow else [])],
+                        deadline=deadline,
+                    )
+                self.__deepen_shallow_repo(
+                    url=url, repo_dir=str(mirror_path), deadline=deadline
+                )
+                utime(path=mirror_path)
+                return str(mirror_path)
+            except CalledProcessError:
+                # renamed default branch or corrupt mirror, clone again
+                rmtree(path=mirror_path, ignore_errors=True)
+
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        self.__clone_repo(
+            url=url,
+            repo_dir=str(mirror_path),
+            is_bare=True,
+            deadline=deadline,
+            reference_dir=reference_dir,
+        )
+        return str(mirror_path)
+
+    def __get_dir_size(self, dir_path: Path) -> int:
+        dir_size: int = 0
+        for file_path in dir_path.rglob("*"):
+            try:
+                dir_size += file_path.stat().st_size if file_path.is_file() else 0
+            except OSError:
+                continue
+        return dir_size
+
+    def __get_alternate_mirrors(self, mirror_path: Path) -> set[Path]:
+        try:
+            return {
+                Path(alternate_objects.strip()).parent.resolve()
+                for alternate_objects in mirror_path.joinpath(self.__ALTERNATES_FILE)
+                .read_text(encoding="utf-8")
+                .splitlines()
+                if alternate_objects.strip()
+            }
+        except OSError:
+            return set()
+
+    def __evict_mirrors(self) -> None:
+        if not self.__mirror_dir or not self.__mirror_dir.is_dir():
+            return
+        mirrors: list[tuple[Path, float, int]] = []
+        for mirror_path in self.__mirror_dir.glob(f"*/*{self.__MIRROR_EXT}"):
+            try:
+                mirror_mtime: float = mirror_path.stat().st_mtime
+            except OSError:
+                continue
+            mirrors.append(
+                (mirror_path, mirror_mtime, self.__get_dir_size(dir_path=mirror_path))
+            )
+        mirrors_size: int = sum(mirror_size for _, _, mirror_size in mirrors)
+
+        # forks borrow objects from their parent mirror, so a parent is kept with its forks
+        mirror_alternates: dict[Path, set[Path]] = {
+            mirror_path.resolve(): self.__get_alternate_mirrors(mirror_path=mirror_path)
+            for mirror_path, _, _ in mirrors
+        }
+        mirrors_kept: set[Path] = {
+            mirror_path.resolve() for mirror_path in self.__mirrors_in_use
+        }
+        for mirror_path in list(mirrors_kept):
+            mirrors_kept.update(mirror_alternates.get(mirror_path, set()))
+
+        # least recently used first, keeping the mirrors of this run
+        mirrors_evicted: set[Path] = set()
+        for mirror_path, _, mirror_size in sorted(mirrors, key=lambda m: m[1]):
+            if mirrors_size <= self.__mirror_max_size:
+                break
+            if mirror_path.resolve() in mirrors_kept | mirrors_evicted:
+                continue
+            mirrors_evicted.add(mirror_path.resolve())
+            rmtree(path=mirror_path, ignore_errors=True)
+            mirrors_size -= mirror_size
+            # forks left without their parent's objects are unusable
+            for fork_path, _, fork_size in mirrors:
+                if fork_path.resolve() not in mirrors_kept | mirrors_evicted and (
+                    mirror_path.resolve() in mirror_alternates[fork_path.resolve()]
+                ):
+                    mirrors_evicted.add(fork_path.resolve())
+                    rmtree(path=fork_path, ignore_errors=True)
+                    mirrors_size -= fork_size
+
+    def __get_head_sha(self, repo_dir: str, deadline: float = None) -> str:
         return self.__get_completed_process(
+            args=["git", "-C", repo_dir, "rev-parse", "--verify", "HEAD"],
+            deadline=deadline,
+        ).stdout.strip()
+
+    def __is_ancestor(
+        self, repo_dir: str, commit_sha: str, deadline: float = None
+    ) -> bool:
+        try:
+            self.__get_completed_process(
+                args=[
+                    "git",
+                    "-C",
+                    repo_dir,
+                    "merge-base",
+                    "--is-ancestor",
+                    commit_sha,
+                    "HEAD",
+                ],
+                deadline=deadline,
+            )
+            return True
+        except CalledProcessError:
+            return False  # not an ancestor, or the commit no longer exists
+
+    def __get_stats_key(self, owner_repo: str, exclude_key: str) -> str:
+        return ":".join(
+            [
+                str(self.__CHECKPOINT_VERSION),
+                self.__stats_metric.value,
+                str(int(self.__is_detect_renames)),
+                exclude_key,
+                owner_repo.lower(),
+            ]
+        )
+
+    def __get_checkpoint_key(self, owner_repo: str) -> str:
+        # found without a clone, the checkpoint stores the excludes it was counted with
+        return self.__get_stats_key(
+            owner_repo=owner_repo,
+            exclude_key=(
+                ",".join(sorted(self.__exclude_paths))
+                if self.__exclude_paths is not None
+                else self.__GITATTRIBUTES_REV
+            ),
+        )
+
+    def __get_result_key(self, owner_repo: str, head_sha: str) -> str:
+        # the head sha fixes the .gitattributes excludes
+        result_key: str = (
+            f"{self.__get_checkpoint_key(owner_repo=owner_repo)}@{head_sha}"
+        )
+        return (
+            f"{result_key}~{self.__since_date.isoformat()}"
+            if self.__since_date
+            else result_key
+        )
+
+    def __fetch_remote_head_sha(self, owner_repo: str) -> str | None:
+        # not the GraphQL repo data, which the response cache can serve stale
+        try:
+            return (
+                self.__get_completed_process(
+                    args=[
+                        "git",
+                        "ls-remote",
+                        f"https://github.com/{owner_repo}.git",
+                        "HEAD",
+                    ],
+                    deadline=monotonic() + self.__LS_REMOTE_TIME_OUT,
+                ).stdout.split()
+                or [None]
+            )[0]
+        except (CalledProcessError, TimeoutExpired):
+            return None
+
+    def __load_result(
+        self, owner_repo: str
+    ) -> list[dict[str, str | dict[str, int]]] | None:
+        if self.__is_cache_bypass:
+            return None
+        head_sha: str | None = self.__fetch_remote_head_sha(owner_repo=owner_repo)
+        contribution_data: list[dict] | None = (
+            self.__result_cache.get(
+                key=self.__get_result_key(owner_repo=owner_repo, head_sha=head_sha)
+            )
+            if head_sha
+            else None
+        )
+        if not isinstance(contribution_data, list):
+            return None
+        for contributor in contribution_data:
+            for id_key in (
+                enums.RepoPinsResDictKeys.AUTHOR.value,
+                enums.RepoPinsResDictKeys.EMAIL.value,
+            ):
+                contributor[id_key] = set(contributor.get(id_key, []))
+        return contribution_data
+
+    def __save_result(
+        self,
+        owner_repo: str,
+        head_sha: str,
+        contribution_data: list[dict[str, str | dict[str, int]]],
+    ) -> None:
+        self.__result_cache.set(
+            key=self.__get_result_key(owner_repo=owner_repo, head_sha=head_sha),
+            value=[
+                {
+                    data_key: (
+                        sorted(data_value, key=str)
+                        if isinstance(data_value, set)
+                        else data_value
+                    )
+                    for data_key, data_value in contributor.items()
+                }
+                for contributor in contribution_data
+            ],
+        )
+
+    def __is_login_user(self, contributor: dict[str, str | int]) -> bool:
+        contributor_login, contributor_name, contributor_email = (
+            (contributor.get(id_key) or "").strip().lower()
+            for id_key in (
+                enums.RepoPinsResDictKeys.LOGIN.value,
+                enums.RepoPinsResDictKeys.NAME.value,
+                enums.RepoPinsResDictKeys.EMAIL.value,
+            )
+        )
+        user_name: str = (self.__gh_api_client.user_name or "").strip().lower()
+        return (
+            contributor_login == self.__gh_api_client.username.strip().lower()
+            or (user_name != "" and contributor_name == user_name)
+            # the GitHub email, also matching by id after a username change
+            or (
+                contributor_email.startswith(f"{self.__gh_api_client.user_id}+")
+                and contributor_email.endswith(self.__NO_REPLY_EMAIL_DOMAIN)
+            )
+        )
+
+    def __fetch_sole_contribution_data(
+        self, owner_repo: str
+    ) -> list[dict[str, str | dict[str, int]]] | None:
+        if not self.__gh_api_client:
+            return None
+        repo_owner, _, repo_name = owner_repo.partition("/")
+        contributor: dict[str, str | int] | None = (
+            self.__gh_api_client.fetch_repo_sole_contributor(
+                repo_owner=repo_owner, repo_name=repo_name
+            )
+        )
+        # the contributor list ignores co-author trailers, which are then not credited
+        if not contributor or not self.__is_login_user(contributor=contributor):
+            return None
+        username: str = self.__gh_api_client.username.strip().lower()
+        return [
+            {
+                enums.RepoPinsResDictKeys.LOGIN.value: username,
+                enums.RepoPinsResDictKeys.STATS.value: (
+                    contributor.get(enums.RepoPinsResDictKeys.CONTRIBUTIONS.value) or 1
+                ),
+                enums.RepoPinsResDictKeys.AUTHOR.value: {
+                    username,
+                    *(
+                        [self.__gh_api_client.user_name.strip().lower()]
+                        if self.__gh_api_client.user_name
+                        else []
+                    ),
+                },
+                enums.RepoPinsResDictKeys.EMAIL.value: {
+                    f"{self.__gh_api_client.user_id}+{username}"
+                    + self.__NO_REPLY_EMAIL_DOMAIN
+                },
+            }
+        ]
+
+    def __precheck_contribution_data(
+        self, owner_repo: str, repo: dict
+    ) -> list[dict[str, str | dict[str, int]]] | None:
+        contribution_data: list[dict] | None = (
+            self.__load_result(owner_repo=owner_repo)
+            if self.__stats_backend == enums.RepoPinStatsBackendEnum.GIT
+            else None
+        )
+        if contribution_data is None:
+            contribution_data = self.__fetch_sole_contribution_data(
+                owner_repo=owner_repo
+            )
+        return contribution_data
+
+    def __get_exclude_pathspec(self, path_pattern: str) -> str:
+        # gitattributes patterns without a leading or inner slash match at any depth
+        is_anchored: bool = "/" in path_pattern.rstrip("/")
+        path_pattern = path_pattern.lstrip("/")
+        if path_pattern.endswith("/"):
+            path_pattern += "**"
+        if not is_anchored:
+            path_pattern = "**/" + path_pattern
+        return f":(exclude,glob){path_pattern}"
+
+    def __get_exclude_pathspecs(
+        self, repo_dir: str | None, deadline: float = None
+    ) -> list[str]:
+        if self.__exclude_paths is not None:
+            return [
+                self.__get_exclude_pathspec(path_pattern=path_pattern)
+                for path_pattern in self.__exclude_paths
+            ]
+        try:
+            gitattributes: str = self.__get_completed_process(
+                args=["git", "-C", repo_dir, "show", self.__GITATTRIBUTES_REV],
+                deadline=deadline,
+            ).stdout
+        except CalledProcessError:
+            return []  # no .gitattributes at HEAD
+
+        exclude_pathspecs: list[str] = []
+        for gitattributes_line in gitattributes.splitlines():
+            path_pattern, *path_attrs = gitattributes_line.split() or [""]
+            if not path_pattern or path_pattern.startswith("#"):
+                continue
+            if self.__EXCLUDE_ATTRS.intersection(path_attrs):
+                exclude_pathspecs.append(
+                    self.__get_exclude_pathspec(path_pattern=path_pattern)
+                )
+        return exclude_pathspecs
+
+    def __load_checkpoint(
+        self, owner_repo: str
+    ) -> tuple[RepoPinStatsIndex, list[str], list[str]]:
+        checkpoint: dict | None = (
+            self.__checkpoint_cache.get(
+                key=self.__get_checkpoint_key(owner_repo=owner_repo)
+            )
+            if not self.__is_cache_bypass and not self.__since_date
+            else None
+        )
+        try:
+            return (
+                RepoPinStatsIndex(
+                    repo_file_changes_add=dict(checkpoint[self.__CHECKPOINT_ADD]),
+                    repo_file_changes_del=dict(checkpoint[self.__CHECKPOINT_DEL]),
+                    commit_log_author_emails={
+                        commit_author: {
+                            id_key: set(id_values)
+                            for id_key, id_values in commit_id.items()
+                        }
+                        for commit_author, commit_id in checkpoint[
+                            self.__CHECKPOINT_IDS
+                        ].items()
+                    },
+                ),
+                list(checkpoint[self.__CHECKPOINT_SHAS]),
+                list(checkpoint[self.__CHECKPOINT_PATHSPECS]),
+            )
+        except (KeyError, TypeError, AttributeError):
+            return RepoPinStatsIndex(), [], []
+
+    def __save_checkpoint(
+        self,
+        owner_repo: str,
+        exclude_pathspecs: list[str],
+        commit_shas: list[str],
+        stats_index: RepoPinStatsIndex,
+    ) -> None:
+        repo_file_changes_add, repo_file_changes_del, commit_log_author_emails = (
+            stats_index.to_dicts()
+        )
+        self.__checkpoint_cache.set(
+            key=self.__get_checkpoint_key(owner_repo=owner_repo),
+            value={
+                self.__CHECKPOINT_SHAS: sorted(commit_shas),
+                self.__CHECKPOINT_PATHSPECS: sorted(set(exclude_pathspecs)),
+                self.__CHECKPOINT_ADD: repo_file_changes_add,
+                self.__CHECKPOINT_DEL: repo_file_changes_del,
+                self.__CHECKPOINT_IDS: {
+                    commit_author: {
+                        id_key: sorted(id_values, key=str)
+                        for id_key, id_values in commit_id.items()
+                    }
+                    for commit_author, commit_id in commit_log_author_emails.items()
+                },
+            },
+        )
+
+    def __fetch_git_commit_data(
+        self,
+        repo_dir: str,
+        rev_range: list[str] = None,
+        exclude_pathspecs: list[str] = None,
+        deadline: float = None,
+    ) -> Iterator[bytes]:
+        return self.__stream_process(
             args=[
                 "git",
                 "-C",
-                tmp_dir,
+                repo_dir,
                 "-c",
                 "i18n.logOutputEncoding=UTF-8",
                 "log",
-                "HEAD",
+                *(rev_range if rev_range else ["HEAD"]),
                 "--use-mailmap",
-                "--no-merges",
+                # oldest first with merges and rewritten parents, so progress can be
+                # checkpointed, merges have no numstat
+                "--topo-order",
+                "--reverse",
+                "--parents",
+                *self.__get_since_args(arg_name="since"),
                 "--numstat",
-                "--format={} %aN <%aE>%n%B%n".format(self.__AUTHOR_LABEL),
-            ]
+                *([] if self.__is_detect_renames else ["--no-renames"]),
+                "-z",
+                f"--format={self.__GIT_LOG_FORMAT}",
+                "--",
+                *(exclude_pathspecs if exclude_pathspecs else []),
+            ],
+            deadline=deadline,
         )
 
-    def __format_author_email_str(self, author_str: str) -> tuple[str, str]:
-        author_email: list[str] = author_str.lower().split(self.__EMAIL_OPEN_BRACKET)
-        return author_email[0].strip(), (
-            author_email[1].strip().rstrip(">").strip()
-            if len(author_email) > 1
-            else None
-        )
+    def __fetch_git_commit_counts(
+        self,
+        repo_dir: str,
+        rev_range: list[str] = None,
+        exclude_pathspecs: list[str] = None,
+        deadline: float = None,
+    ) -> str:
+        # co-author trailers are counted as their own commit group, no diffs are computed
+        return self.__get_completed_process(
+            args=[
+                "git",
+                "-C",
+                repo_dir,
+                "-c",
+                "i18n.logOutputEncoding=UTF-8",
+                "shortlog",
+                "-sne",
+                "--no-merges",
+                *self.__get_since_args(arg_name="since"),
+                "--group=author",
+                "--group=trailer:co-authored-by",
+                *(rev_range if rev_range else ["HEAD"]),
+                "--",
+                *(exclude_pathspecs if exclude_pathspecs else []),
+            ],
+            deadline=deadline,
+        ).stdout
 
-    def __fetch_repo_stats(
-        self, owner_repo: str
-    ) -> list[dict[str, str | dict[str, int]]]:
-        url: str = (
-            f"https://{(self.__gh_token + "@") if self.__gh_token else ""}github.com/{owner_repo}.git"
+    def __parse_commit_counts(
+        self, commit_counts: str, stats_index: RepoPinStatsIndex
+    ) -> None:
+        for commit_count_line in commit_counts.splitlines():
+            count_str, _, commit_identity = commit_count_line.strip().partition("\t")
+            identity_match = self.__IDENTITY_REG.fullmatch(string=commit_identity)
+            if not count_str.isdigit() or not identity_match:
+                continue
+            stats_index.add_changes(
+                author=identity_match.group(1).lower(),
+                email=identity_match.group(2).strip().lower() or None,
+                additions=int(count_str),
+                deletions=0,
+            )
+
+    def __iter_commit_records(self, commit_chunks: Iterator[bytes]) -> Iterator[bytes]:
+        # joined once per record, a large commit spanning many chunks is not re-copied
+        pending_chunks: list[bytes] = []
+        for commit_chunk in commit_chunks:
+            *commit_records, pending_chunk = commit_chunk.split(self.__RECORD_SEP)
+            if commit_records:
+                commit_records[0] = b"".join(pending_chunks) + commit_records[0]
+                pending_chunks = []
+                yield from commit_records
+            pending_chunks.append(pending_chunk)
+        yield b"".join(pending_chunks)
+
+    def __parse_commit_record(
+        self, commit_record: bytes
+    ) -> tuple[str, list[str], list[tuple[str, str | None]], int, int, bool]:
+        commit_header, _, commit_numstat = commit_record.partition(self.__NUMSTAT_SEP)
+        commit_sha, commit_parents, commit_author, commit_email, *co_authors = (
+            commit_header.decode(encoding="utf-8", errors="ignore").split(
+                self.__FIELD_SEP
+            )
         )
-        tmp_dir: str = mkdtemp(prefix=self.__TMP_DIR)
+        commit_authors_emails: list[tuple[str, str | None]] = [
+            (commit_author.strip().lower(), commit_email.strip().lower() or None)
+        ]
+        for co_author in co_authors:
+            co_author_match = self.__IDENTITY_REG.fullmatch(string=co_author)
+            if co_author_match:
+                commit_authors_emails.append(
+                    (
+                        co_author_match.group(1).lower(),
+                        co_author_match.group(2).strip().lower(),
+                    )
+                )
 
-        repo_file_changes_add, repo_file_changes_del, commit_log_author_emails = (
-            {},
-            {},
-            {},
+        commit_add, commit_del, is_commit_changes = 0, 0, False
+        file_changes: Iterator[bytes] = iter(
+            commit_numstat.lstrip().split(self.__NUMSTAT_SEP)
         )
-        try:
-            commit_data: CompletedProcess[str] | None = self.__fetch_git_commit_data(
-                url=url, tmp_dir=tmp_dir
-            )
-            if not commit_data or not commit_data.stdout:
-                return []
-
-            commit_authors_emails: list[tuple[str, str]] = []
-            for commit_line in commit_data.stdout.splitlines():
-                if self.__AUTHOR_REG.fullmatch(string=commit_line):
-                    commit_authors_emails = [
-                        self.__format_author_email_str(
-                            author_str=commit_line.split(self.__AUTHOR_LABEL)[
-                                -1
-                            ].strip()
-                        )
-                    ]
-                    continue
-                co_author = self.__CO_AUTHOR_REG.search(string=commit_line)
-                if co_author:
-                    commit_authors_emails.append(
-                        self.__format_author_email_str(
-                            author_str=co_author.group()
-                            .lower()
-                            .split(self.__CO_AUTHOR_LABEL.lower())[1]
-                            .strip()
-                        )
+        for file_change in file_changes:
+            add_str, _, file_change = file_change.partition(b"\t")
+            del_str, _, file_path = file_change.partition(b"\t")
+            if not file_path and self.__is_detect_renames:
+                # renames and copies list the old and new paths as their own fields
+                next(file_changes, None)
+                next(file_changes, None)
+            if add_str == self.__BINARY_NUMSTAT:
+                continue
+            if add_str.isdigit() and del_str.isdigit():
+                commit_add += int(add_str)
+                commit_del += int(del_str)
+                is_commit_changes = True
+        return (
+            commit_sha.strip(),
+            commit_parents.split(),
+            commit_authors_emails,
+            commit_add,
+            commit_del,
+            is_commit_changes,
+        )
+
+    def __attribute_commit_changes(
+        self,
+        stats_index: RepoPinStatsIndex,
+        commit_authors_emails: list[tuple[str, str | None]],
+        commit_add: int,
+        commit_del: int,
+    ) -> None:
+        add_share, add_remainder = divmod(commit_add, len(commit_authors_emails))
+        del_share, del_remainder = divmod(commit_del, len(commit_authors_emails))
+        # remainders go one line each to the first authors, so commit totals are kept
+        for i, (commit_author, commit_email) in enumerate(commit_authors_emails):
+            stats_index.add_changes(
+                author=commit_author,
+                email=commit_email,
+                additions=add_share + (1 if i < add_remainder else 0),
+                deletions=del_share + (1 if i < del_remainder else 0),
+            )
+
+    def __parse_commit_log(
+        self,
+        commit_chunks: Iterator[bytes],
+        stats_index: RepoPinStatsIndex,
+        head_shas: set[str],
+    ) -> None:
+        # parents come first, so the parsed commits are always the history of
+        # head_shas, a checkpoint a later run can resume from
+        for commit_record in self.__iter_commit_records(commit_chunks=commit_chunks):
+            if not commit_record:
+                continue
+            (
+                commit_sha,
+                commit_parents,
+                commit_authors_emails,
+                commit_add,
+                commit_del,
+                is_commit_changes,
+            ) = self.__parse_commit_record(commit_record=commit_record)
+            if is_commit_changes and len(commit_parents) < 2:
+                self.__attribute_commit_changes(
+                    stats_index=stats_index,
+                    commit_authors_emails=commit_authors_emails,
+                    commit_add=commit_add,
+                    commit_del=commit_del,
+                )
+            head_shas.difference_update(commit_parents)
+            head_shas.add(commit_sha)
+
+    def __acquire_clone_slot(self) -> None:
+        with self.__clone_condition:
+            while self.__clone_active >= self.__clone_concurrency:
+                self.__clone_condition.wait()
+            self.__clone_active += 1
+
+    def __release_clone_slot(self, num_bytes: int, duration: float) -> None:
+        with self.__clone_condition:
+            self.__clone_active -= 1
+            if num_bytes >= self.__MIN_THROUGHPUT_SAMPLE and duration > 0:
+                # per clone throughput dropping as clones are added means the link is saturated
+                throughput: float = num_bytes / duration
+                self.__clone_max_throughput = max(
+                    self.__clone_max_throughput, throughput
+                )
+                if throughput >= self.__clone_max_throughput / 2:
+                    self.__clone_concurrency = min(
+                        self.__MAX_CLONE_WORKERS, self.__clone_concurrency + 1
                     )
-                    continue
+                elif throughput < self.__clone_max_throughput / 4:
+                    self.__clone_concurrency = max(1, self.__clone_concurrency - 1)
+            self.__clone_condition.notify_all()
 
-                if commit_authors_emails and self.__NUMSTAT_REG.match(
-                    string=commit_line
-                ):
-                    add_str, del_str, _ = commit_line.split(sep="\t")
-                    if add_str.isdigit() and del_str.isdigit():
-                        is_email_match: bool = False
-                        for commit_author, commit_email in commit_authors_emails:
-                            commit_author_key: str = commit_author
-                            for (
-                                commit_log_author,
-                                commit_log_id,
-                            ) in commit_log_author_emails.items():
-                                for commit_log_email in commit_log_id.get(
-                                    enums.RepoPinsResDictKeys.EMAIL.value, set()
-                                ):
-                                    if commit_log_email == commit_email:
-                                        if len(commit_log_author) > len(commit_author):
-                                            commit_author_key = commit_log_author
-                                        is_email_match = True
-                                        break
-                                if is_email_match:
-                                    break
-
-                            repo_file_changes_add[commit_author_key] = (
-                                repo_file_changes_add.get(commit_author_key, 0)
-                                + int(add_str) // len(commit_authors_emails)
-                            )
-                            repo_file_changes_del[commit_author_key] = (
-                                repo_file_changes_del.get(commit_author_key, 0)
-                                + int(del_str) // len(commit_authors_emails)
-                            )
-
-                            commit_log_author_emails[commit_author_key] = (
-                                commit_log_author_emails.get(
-                                    commit_author_key,
-                                    {
-                                        enums.RepoPinsResDictKeys.AUTHOR.value: set(),
-                                        enums.RepoPinsResDictKeys.EMAIL.value: set(),
-                                    },
-                                )
-                            )
-                            commit_log_author_emails[commit_author_key][
-                                enums.RepoPinsResDictKeys.AUTHOR.value
-                            ].add(commit_author)
-                            commit_log_author_emails[commit_author_key][
-                                enums.RepoPinsResDictKeys.EMAIL.value
-                            ].add(commit_email)
+    def __is_valid_repo(self, repo_dir: str) -> bool:
+        try:
+            return bool(self.__get_head_sha(repo_dir=repo_dir))
+        except CalledProcessError:
+            return False
 
+    def __is_mirrored(self, owner_repo: str) -> bool:
+        return (
+            bool(self.__mirror_dir) and owner_repo.lower() not in self.__private_repos
+        )
+
+    def __fetch_repo(
+        self,
+        owner_repo: str,
+        tmp_dir: str,
+        reference_clone: Future | None = None,
+    ) -> tuple[str | None, bool]:
+        url: str = f"https://github.com/{owner_repo}.git"
+        is_mirrored: bool = self.__is_mirrored(owner_repo=owner_repo)
+        reference_dir: str | None = None
+        if reference_clone:
+            try:
+                reference_dir = reference_clone.result()[0]
+            except RepoPinStatsError:
+                pass  # the fork is cloned in full
+            # a mirror cannot borrow objects from a clone removed after the run
+            if (
+                is_mirrored
+                and reference_dir
+                and self.__mirror_dir not in (Path(reference_dir).parents)
+            ):
+                reference_dir = None
+        repo_dir: str = (
+            str(self.__mirror_dir.joinpath(owner_repo.lower() + self.__MIRROR_EXT))
+            if is_mirrored
+            else mkdtemp(prefix=self.__TMP_DIR, dir=tmp_dir)
+        )
+        repo_size: int = self.__get_dir_size(dir_path=Path(repo_dir))
+
+        self.__acquire_clone_slot()
+        start_time: float = monotonic()
+        try:
+            if is_mirrored:
+                self.__update_mirror(
+                    url=url,
+                    owner_repo=owner_repo,
+                    deadline=start_time + self.__clone_time_out,
+                    reference_dir=reference_dir,
+                )
+            else:
+                self.__clone_repo(
+                    url=url,
+                    repo_dir=repo_dir,
+                    deadline=start_time + self.__clone_time_out,
+                    reference_dir=reference_dir,
+                )
         except CalledProcessError as err:
+            if not is_mirrored:
+                rmtree(path=repo_dir, ignore_errors=True)
             raise RepoPinStatsError(
                 msg=f"Git process error: {err.stderr.strip() or err.stdout.strip() or err}"
             )
+        except TimeoutExpired:
+            # a timed out fetch leaves the previous mirror usable, a timed out clone does not
+            is_stale_repo: bool = self.__is_valid_repo(repo_dir=repo_dir)
+            fallback: str = (
+                "using the previous mirror"
+                if is_stale_repo
+                else "using cached stats only"
+            )
+            self.__log.warning(
+                msg=f"Contribution stats clone of {owner_repo} exceeded {self.__clone_time_out}s, {fallback}"
+            )
+            if not is_stale_repo:
+                rmtree(path=repo_dir, ignore_errors=True)
+            return repo_dir if is_stale_repo else None, True
         finally:
-            rmtree(path=tmp_dir, ignore_errors=True)
+            self.__release_clone_slot(
+                num_bytes=max(
+                    0, self.__get_dir_size(dir_path=Path(repo_dir)) - repo_size
+                ),
+                duration=monotonic() - start_time,
+            )
+        return repo_dir, False
+
+    def __fetch_fallback_stats(
+        self, owner_repo: str, repo_dir: str, stats_index: RepoPinStatsIndex
+    ) -> RepoPinStatsIndex:
+        if self.__stats_metric == enums.RepoPinStatsMetricEnum.LINES:
+            try:
+                fallback_stats_index: RepoPinStatsIndex = RepoPinStatsIndex()
+                self.__parse_commit_counts(
+                    commit_counts=self.__fetch_git_commit_counts(
+                        repo_dir=repo_dir, deadline=monotonic() + self.__log_time_out
+                    ),
+                    stats_index=fallback_stats_index,
+                )
+                self.__log.warning(
+                    msg=f"Contribution stats of {owner_repo} exceeded {self.__log_time_out}s, "
+                    f"using commit counts"
+                )
+                return fallback_stats_index
+            except (CalledProcessError, TimeoutExpired):
+                pass
+        self.__log.warning(
+            msg=f"Contribution stats of {owner_repo} exceeded {self.__log_time_out}s, "
+            f"using partial stats"
+        )
+        return stats_index
 
+    def __get_contribution_data(
+        self,
+        repo_file_changes_add: dict[str, int],
+        repo_file_changes_del: dict[str, int],
+        commit_log_author_emails: dict[str, dict[str, set]],
+    ) -> list[dict[str, str | dict[str, int]]]:
         commit_authors: set[str] = set(repo_file_changes_add.keys())
         return [
             {
@@ -203,6 +1080,260 @@ class RepoPinStats:
             for commit_author in commit_authors
         ]
 
+    def __fetch_repo_stats(
+        self, owner_repo: str, repo_dir: str | None, is_partial: bool = False
+    ) -> tuple[list[dict[str, str | dict[str, int]]], bool]:
+        stats_index, last_shas, last_pathspecs = self.__load_checkpoint(
+            owner_repo=owner_repo
+        )
+        if not repo_dir:
+            return self.__get_contribution_data(*stats_index.to_dicts()), True
+
+        deadline: float = monotonic() + self.__log_time_out
+        head_sha: str | None = None
+        exclude_pathspecs: list[str] = last_pathspecs
+        parsed_shas: set[str] = set(last_shas)  # stats_index is their history
+        try:
+            head_sha = self.__get_head_sha(repo_dir=repo_dir, deadline=deadline)
+            exclude_pathspecs = self.__get_exclude_pathspecs(
+                repo_dir=repo_dir, deadline=deadline
+            )
+            if sorted(set(exclude_pathspecs)) != last_pathspecs:
+                # counted with other excludes, such as before a .gitattributes edit
+                last_shas, parsed_shas = [], set()
+                stats_index = RepoPinStatsIndex()
+            if last_shas != [head_sha]:
+                rev_range: list[str] = ["HEAD"]
+                if last_shas and all(
+                    self.__is_ancestor(
+                        repo_dir=repo_dir, commit_sha=last_sha, deadline=deadline
+                    )
+                    for last_sha in last_shas
+                ):
+                    rev_range = ["HEAD", "--not", *last_shas]
+                else:
+                    # no checkpoint, or history rewritten by a force-push
+                    parsed_shas = set()
+                    stats_index = RepoPinStatsIndex()
+
+                if self.__stats_metric == enums.RepoPinStatsMetricEnum.COMMITS:
+                    self.__parse_commit_counts(
+                        commit_counts=self.__fetch_git_commit_counts(
+                            repo_dir=repo_dir,
+                            rev_range=rev_range,
+                            exclude_pathspecs=exclude_pathspecs,
+                            deadline=deadline,
+                        ),
+                        stats_index=stats_index,
+                    )
+                else:
+                    self.__parse_commit_log(
+                        commit_chunks=self.__fetch_git_commit_data(
+                            repo_dir=repo_dir,
+                            rev_range=rev_range,
+                            exclude_pathspecs=exclude_pathspecs,
+                            deadline=deadline,
+                        ),
+                        stats_index=stats_index,
+                        head_shas=parsed_shas,
+                    )
+                # a sliding window drops old commits, so it is never counted incrementally
+                if not self.__since_date:
+                    self.__save_checkpoint(
+                        owner_repo=owner_repo,
+                        exclude_pathspecs=exclude_pathspecs,
+                        commit_shas=[head_sha],
+                        stats_index=stats_index,
+                    )
+
+        except CalledProcessError as err:
+            raise RepoPinStatsError(
+                msg=f"Git process error: {err.stderr.strip() or err.stdout.strip() or err}"
+            )
+        except TimeoutExpired:
+            # the counted history is checkpointed, so a later run resumes after it
+            if parsed_shas and parsed_shas != set(last_shas) and not self.__since_date:
+                self.__save_checkpoint(
+                    owner_repo=owner_repo,
+                    exclude_pathspecs=exclude_pathspecs,
+                    commit_shas=list(parsed_shas),
+                    stats_index=stats_index,
+                )
+            stats_index = self.__fetch_fallback_stats(
+                owner_repo=owner_repo, repo_dir=repo_dir, stats_index=stats_index
+            )
+            is_partial = True
+        finally:
+            # temp clones referenced by forks are removed with the run's temp dir
+            if (
+                not self.__is_mirrored(owner_repo=owner_repo)
+                and owner_repo.lower() not in self.__reference_repos
+            ):
+                rmtree(path=repo_dir, ignore_errors=True)
+
+        contribution_data: list[dict[str, str | dict[str, int]]] = (
+            self.__get_contribution_data(*stats_index.to_dicts())
+        )
+        if head_sha and not is_partial:
+            self.__save_result(
+                owner_repo=owner_repo,
+                head_sha=head_sha,
+                contribution_data=contribution_data,
+            )
+        return contribution_data, is_partial
+
+    def __get_api_contribution_data(
+        self, owner_repo: str, contributor_weeks: list[dict[str, str | int | list]]
+    ) -> list[dict[str, str | dict[str, int]]]:
+        since_time: float = (
+            datetime(
+                year=self.__since_date.year,
+                month=self.__since_date.month,
+                day=self.__since_date.day,
+                tzinfo=UTC,
+            ).timestamp()
+            if self.__since_date
+            else 0.0
+        )
+        stats_index: RepoPinStatsIndex = RepoPinStatsIndex()
+        commits_index: RepoPinStatsIndex = RepoPinStatsIndex()
+        for contributor in contributor_weeks:
+            login: str = (
+                (contributor.get(enums.RepoPinsResDictKeys.LOGIN.value) or "")
+                .strip()
+                .lower()
+            ) or self.__GHOST_LOGIN
+            user_id: int | None = contributor.get(enums.RepoPinsResDictKeys.ID.value)
+            email: str = (
+                f"{user_id}+{login}" if user_id else login
+            ) + self.__NO_REPLY_EMAIL_DOMAIN
+            weeks: list[dict[str, int]] = [
+                week
+                for week in contributor.get(enums.RepoPinsResDictKeys.WEEKS.value) or []
+                if (week.get(enums.RepoPinsResDictKeys.WEEK_START.value) or 0)
+                + self.__WEEK_SECONDS
+                > since_time
+                and week.get(enums.RepoPinsResDictKeys.WEEK_COMMITS.value)
+            ]
+            if not weeks:
+                continue  # no commits in the window
+            stats_index.add_changes(
+                author=login,
+                email=email,
+                additions=sum(
+                    week.get(enums.RepoPinsResDictKeys.WEEK_ADDITIONS.value) or 0
+                    for week in weeks
+                ),
+                deletions=sum(
+                    week.get(enums.RepoPinsResDictKeys.WEEK_DELETIONS.value) or 0
+                    for week in weeks
+                ),
+            )
+            commits_index.add_changes(
+                author=login,
+                email=email,
+                additions=sum(
+                    week.get(enums.RepoPinsResDictKeys.WEEK_COMMITS.value) or 0
+                    for week in weeks
+                ),
+                deletions=0,
+            )
+
+        repo_file_changes_add, repo_file_changes_del, commit_log_author_emails = (
+            stats_index.to_dicts()
+        )
+        commit_counts: dict[str, int] = commits_index.to_dicts()[0]
+        if self.__stats_metric == enums.RepoPinStatsMetricEnum.COMMITS:
+            repo_file_changes_add, repo_file_changes_del = commit_counts, {}
+        elif not any(repo_file_changes_add.values()) and not any(
+            repo_file_changes_del.values()
+        ):
+            # line changes are not computed for repos of 10,000 or more commits
+            if any(commit_counts.values()):
+                self.__log.warning(
+                    msg=f"Contribution stats of {owner_repo} have no line changes, "
+                    f"using commit counts"
+                )
+            repo_file_changes_add, repo_file_changes_del = commit_counts, {}
+        # zero totals are dropped, so the login user share is never divided by zero
+        return [
+            contributor
+            for contributor in self.__get_contribution_data(
+                repo_file_changes_add=repo_file_changes_add,
+                repo_file_changes_del=repo_file_changes_del,
+                commit_log_author_emails=commit_log_author_emails,
+            )
+            if contributor[enums.RepoPinsResDictKeys.STATS.value]
+        ]
+
+    def __fetch_api_contribution_stats(self, tasks: list[tuple[str, dict]]) -> None:
+        # one shared poll queue by due time, workers only send requests and never wait
+        deadline: float = monotonic() + self.__API_POLL_TIME_OUT
+        poll_queue: list[tuple[float, int, int]] = [
+            (monotonic(), task_index, 0) for task_index in range(len(tasks))
+        ]
+        with ThreadPoolExecutor(
+            max_workers=min(self.__API_WORKERS, max(1, len(tasks)))
+        ) as thread_pool:
+            polls: dict[Future, tuple[int, int]] = {}
+            while poll_queue or polls:
+                while poll_queue and poll_queue[0][0] <= monotonic():
+                    _, task_index, attempt = heappop(poll_queue)
+                    repo_owner, _, repo_name = tasks[task_index][0].partition("/")
+                    polls[
+                        thread_pool.submit(
+                            self.__gh_api_client.fetch_repo_contributor_weeks,
+                            repo_owner,
+                            repo_name,
+                        )
+                    ] = (task_index, attempt)
+                polls_done, _ = wait(
+                    fs=polls,
+                    timeout=(
+                        max(0.0, poll_queue[0][0] - monotonic()) if poll_queue else None
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for k_poll in polls_done:
+                    task_index, attempt = polls.pop(k_poll)
+                    owner_repo, repo = tasks[task_index]
+                    try:
+                        contributor_weeks: list[dict] | None = k_poll.result()
+                    except RequestException as err:
+                        self.__log.warning(
+                            msg=f"Contribution stats of {owner_repo} failed: {err}"
+                        )
+                        repo[enums.RepoPinsResDictKeys.CONTRIBUTION.value] = []
+                        repo[enums.RepoPinsResDictKeys.CONTRIBUTION_PARTIAL.value] = (
+                            True
+                        )
+                        continue
+
+                    if contributor_weeks is None:
+                        poll_time: float = monotonic() + min(
+                            self.__API_POLL_CAP, self.__API_POLL_BASE * 2**attempt
+                        )
+                        if poll_time < deadline:
+                            heappush(poll_queue, (poll_time, task_index, attempt + 1))
+                            continue
+                        self.__log.warning(
+                            msg=f"Contribution stats of {owner_repo} were not computed "
+                            f"within {self.__API_POLL_TIME_OUT}s"
+                        )
+                        repo[enums.RepoPinsResDictKeys.CONTRIBUTION.value] = []
+                        repo[enums.RepoPinsResDictKeys.CONTRIBUTION_PARTIAL.value] = (
+                            True
+                        )
+                        continue
+
+                    repo[enums.RepoPinsResDictKeys.CONTRIBUTION.value] = (
+                        self.__get_api_contribution_data(
+                            owner_repo=owner_repo, contributor_weeks=contributor_weeks
+                        )
+                    )
+                    repo[enums.RepoPinsResDictKeys.CONTRIBUTION_PARTIAL.value] = False
+
     def fetch_contribution_stats(self, repo_list: list[dict]) -> list[dict]:
         tasks: list[tuple[str, dict]] = []
         for repo in repo_list:
@@ -213,15 +1344,100 @@ class RepoPinStats:
             if len(url_tokens) < 2 or not repo_name:
                 continue
             tasks.append((f"{url_tokens[-2].strip()}/{repo_name}", repo))
+        # largest first, so a huge repo started last does not set the total run time
+        tasks.sort(
+            key=lambda task: task[1].get(enums.RepoPinsResDictKeys.DISK_USAGE.value)
+            or 0,
+            reverse=True,
+        )
+
+        # repos unchanged since stats were stored, by any profile,
+        # or with the login user as sole contributor, are not cloned
         with ThreadPoolExecutor(
-            max_workers=min(self.__MAX_WORKERS, max(1, len(repo_list)))
+            max_workers=min(self.__MAX_CLONE_WORKERS, max(1, len(tasks)))
         ) as thread_pool:
-            contribution_data = {
-                thread_pool.submit(self.__fetch_repo_stats, owner_repo): repo
-                for owner_repo, repo in tasks
-            }
-            for k_complete in as_completed(contribution_data):
-                contribution_data[k_complete][
-                    enums.RepoPinsResDictKeys.CONTRIBUTION.value
-                ] = k_complete.result()
+            stored_data: list[list[dict] | None] = list(
+                thread_pool.map(
+                    lambda task: self.__precheck_contribution_data(
+                        owner_repo=task[0], repo=task[1]
+                    ),
+                    tasks,
+                )
+            )
+        for (_, repo), contribution_data in zip(tasks, stored_data):
+            if contribution_data is not None:
+                repo[enums.RepoPinsResDictKeys.CONTRIBUTION.value] = contribution_data
+                repo[enums.RepoPinsResDictKeys.CONTRIBUTION_PARTIAL.value] = False
+        tasks = [
+            task
+            for task, contribution_data in zip(tasks, stored_data)
+            if contribution_data is None
+        ]
+        if self.__stats_backend == enums.RepoPinStatsBackendEnum.API:
+            self.__fetch_api_contribution_stats(tasks=tasks)
+            return repo_list
+
+        # forks whose parent is also in the list are cloned after it, borrowing its objects
+        fork_parents: dict[str, str] = {}
+        owner_repos: set[str] = {owner_repo.lower() for owner_repo, _ in tasks}
+        for owner_repo, repo in tasks:
+            parent_owner_repo: str = (
+                (repo.get(enums.RepoPinsResDictKeys.PARENT.value) or {})
+                .get(enums.RepoPinsResDictKeys.OWNER_REPO.value, "")
+                .lower()
+            )
+            # shallow clones cannot be referenced
+            if (
+                repo.get(enums.RepoPinsResDictKeys.IS_FORK.value)
+                and parent_owner_repo in owner_repos
+                and not self.__since_date
+            ):
+                fork_parents[owner_repo.lower()] = parent_owner_repo
+        self.__reference_repos = set(fork_parents.values())
+        self.__private_repos = {
+            owner_repo.lower()
+            for owner_repo, repo in tasks
+            if repo.get(enums.RepoPinsResDictKeys.IS_PRIVATE.value)
+        }
+        # parents are queued first, so a fork never waits on a clone queued behind it
+        tasks.sort(key=lambda task: task[0].lower() in fork_parents)
+
+        tmp_dir: str = mkdtemp(prefix=self.__TMP_DIR)
+        try:
+            with (
+                ThreadPoolExecutor(
+                    max_workers=min(self.__MAX_CLONE_WORKERS, max(1, len(tasks)))
+                ) as clone_pool,
+                ThreadPoolExecutor(
+                    max_workers=min(cpu_count() or 1, max(1, len(tasks)))
+                ) as parse_pool,
+            ):
+                # a repo is parsed as soon as its clone is done, overlapping other clones
+                clone_data: dict[Future, tuple[str, dict]] = {}
+                repo_clones: dict[str, Future] = {}
+                for owner_repo, repo in tasks:
+                    repo_clones[owner_repo.lower()] = clone_pool.submit(
+                        self.__fetch_repo,
+                        owner_repo,
+                        tmp_dir,
+                        repo_clones.get(fork_parents.get(owner_repo.lower(), "")),
+                    )
+                    clone_data[repo_clones[owner_repo.lower()]] = (owner_repo, repo)
+                contribution_data = {}
+                for k_clone in as_completed(clone_data):
+                    owner_repo, repo = clone_data[k_clone]
+                    contribution_data[
+                        parse_pool.submit(
+                            self.__fetch_repo_stats, owner_repo, *k_clone.result()
+                        )
+                    ] = repo
+                for k_complete in as_completed(contribution_data):
+                    repo = contribution_data[k_complete]
+                    (
+                        repo[enums.RepoPinsResDictKeys.CONTRIBUTION.value],
+                        repo[enums.RepoPinsResDictKeys.CONTRIBUTION_PARTIAL.value],
+                    ) = k_complete.result()
+        finally:
+            rmtree(path=tmp_dir, ignore_errors=True)
+        self.__evict_mirrors()
         return repo_list
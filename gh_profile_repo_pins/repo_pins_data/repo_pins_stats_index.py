@@ -0,0 +1,131 @@
+import gh_profile_repo_pins.repo_pins_enum as enums
+
+
+class RepoPinStatsIndex:
+
+    def __init__(
+        self,
+        repo_file_changes_add: dict[str, int] = None,
+        repo_file_changes_del: dict[str, int] = None,
+        commit_log_author_emails: dict[str, dict[str, set]] = None,
+    ) -> None:
+        # identities are union-find nodes linked by a shared name or email,
+        # so merges do not depend on the order commits (or checkpoints) are added in
+        self.__parents: list[int] = []
+        self.__additions: list[int] = []
+        self.__deletions: list[int] = []
+        self.__author_names: list[set[str]] = []
+        self.__author_emails: list[set[str | None]] = []
+        self.__name_ids: dict[str, int] = {}
+        self.__email_ids: dict[str, int] = {}
+
+        repo_file_changes_add = repo_file_changes_add if repo_file_changes_add else {}
+        repo_file_changes_del = repo_file_changes_del if repo_file_changes_del else {}
+        for commit_author, commit_id in (
+            commit_log_author_emails if commit_log_author_emails else {}
+        ).items():
+            # a checkpointed identity is one node, linked by all of its names and emails
+            author_id: int = self.__add_identity(
+                author_names={
+                    commit_author,
+                    *commit_id.get(enums.RepoPinsResDictKeys.AUTHOR.value, set()),
+                },
+                author_emails=commit_id.get(
+                    enums.RepoPinsResDictKeys.EMAIL.value, set()
+                ),
+            )
+            self.__additions[author_id] += repo_file_changes_add.get(commit_author, 0)
+            self.__deletions[author_id] += repo_file_changes_del.get(commit_author, 0)
+
+    def __find(self, author_id: int) -> int:
+        while self.__parents[author_id] != author_id:
+            self.__parents[author_id] = self.__parents[self.__parents[author_id]]
+            author_id = self.__parents[author_id]
+        return author_id
+
+    def __union(self, author_id: int, other_id: int) -> int:
+        author_id, other_id = self.__find(author_id), self.__find(other_id)
+        if author_id == other_id:
+            return author_id
+        if len(self.__author_names[author_id]) + len(
+            self.__author_emails[author_id]
+        ) < len(self.__author_names[other_id]) + len(self.__author_emails[other_id]):
+            author_id, other_id = other_id, author_id
+        self.__parents[other_id] = author_id
+        self.__additions[author_id] += self.__additions[other_id]
+        self.__deletions[author_id] += self.__deletions[other_id]
+        self.__author_names[author_id].update(self.__author_names[other_id])
+        self.__author_emails[author_id].update(self.__author_emails[other_id])
+        self.__author_names[other_id], self.__author_emails[other_id] = set(), set()
+        return author_id
+
+    def __add_identity(
+        self, author_names: set[str], author_emails: set[str | None]
+    ) -> int:
+        author_id: int = len(self.__parents)
+        self.__parents.append(author_id)
+        self.__additions.append(0)
+        self.__deletions.append(0)
+        self.__author_names.append(set(author_names))
+        self.__author_emails.append(set(author_emails))
+        for author_name in author_names:
+            if author_name in self.__name_ids:
+                author_id = self.__union(author_id, self.__name_ids[author_name])
+            self.__name_ids[author_name] = author_id
+        for author_email in author_emails:
+            if author_email is None:
+                continue  # a missing email links nobody
+            if author_email in self.__email_ids:
+                author_id = self.__union(author_id, self.__email_ids[author_email])
+            self.__email_ids[author_email] = author_id
+        return self.__find(author_id)
+
+    def __get_author_id(self, author: str, email: str | None) -> int:
+        author_id: int | None = (
+            self.__find(self.__name_ids[author]) if author in self.__name_ids else None
+        )
+        email_id: int | None = (
+            self.__find(self.__email_ids[email]) if email in self.__email_ids else None
+        )
+        if author_id is not None and email_id in (None, author_id):
+            self.__author_emails[author_id].add(email)
+            if email is not None:
+                self.__email_ids[email] = author_id
+            return author_id
+        if author_id is None and email_id is not None:
+            self.__author_names[email_id].add(author)
+            self.__name_ids[author] = email_id
+            return email_id
+        return self.__add_identity(author_names={author}, author_emails={email})
+
+    def add_changes(
+        self, author: str, email: str | None, additions: int, deletions: int
+    ) -> None:
+        author_id: int = self.__get_author_id(author=author, email=email)
+        self.__additions[author_id] += additions
+        self.__deletions[author_id] += deletions
+
+    def to_dicts(
+        self,
+    ) -> tuple[dict[str, int], dict[str, int], dict[str, dict[str, set]]]:
+        repo_file_changes_add: dict[str, int] = {}
+        repo_file_changes_del: dict[str, int] = {}
+        commit_log_author_emails: dict[str, dict[str, set]] = {}
+        for author_id, parent_id in enumerate(self.__parents):
+            if author_id != parent_id:
+                continue
+            # the longer name wins, ties broken alphabetically
+            commit_author: str = min(
+                self.__author_names[author_id], key=lambda n: (-len(n), n)
+            )
+            repo_file_changes_add[commit_author] = self.__additions[author_id]
+            repo_file_changes_del[commit_author] = self.__deletions[author_id]
+            commit_log_author_emails[commit_author] = {
+                enums.RepoPinsResDictKeys.AUTHOR.value: set(
+                    self.__author_names[author_id]
+                ),
+                enums.RepoPinsResDictKeys.EMAIL.value: set(
+                    self.__author_emails[author_id]
+                ),
+            }
+        return repo_file_changes_add, repo_file_changes_del, commit_log_author_emails
@@ -11,6 +11,16 @@ class RepositoryOrderFieldEnum(Enum):
     RANDOM = "random"
 
 
+class RepoPinStatsMetricEnum(Enum):
+    LINES = "lines"
+    COMMITS = "commits"
+
+
+class RepoPinStatsBackendEnum(Enum):
+    GIT = "git"
+    API = "api"
+
+
 class RepoPinsImgMediaImgMime(Enum):
     PNG = "image/png"
     JPG = "image/jpeg"
@@ -82,7 +92,9 @@ class RepoPinsImgThemeMode(Enum):
 class RepoPinsResDictKeys(Enum):
     DATA = "data"
     ERROR = "error"
+    ERRORS = "errors"
     MESSAGE = "message"
+    TYPE = "type"
     RATE_LIMIT = "rateLimit"
     COST = "cost"
     URL = "url"
@@ -95,8 +107,12 @@ class RepoPinsResDictKeys(Enum):
     OWNER_REPO = "nameWithOwner"
     STARS = "stargazerCount"
     CONTRIBUTION = "contribution_data"
+    CONTRIBUTION_PARTIAL = "contribution_partial"
+    CONTRIBUTIONS = "contributions"
+    CONTRIBUTOR_COUNT = "contributorCount"
     STATS = "stats"
     FORK_COUNT = "forkCount"
+    DISK_USAGE = "diskUsage"
     ISSUES = "issues"
     ISSUES_HELP = "issuesHelp"
     PULL_REQUESTS = "pullRequests"
@@ -113,6 +129,12 @@ class RepoPinsResDictKeys(Enum):
     DB_ID = "databaseId"
     EMAIL = "email"
     AUTHOR = "author"
+    ID = "id"
+    WEEKS = "weeks"
+    WEEK_START = "w"
+    WEEK_ADDITIONS = "a"
+    WEEK_DELETIONS = "d"
+    WEEK_COMMITS = "c"
 
 
 def update_enum(enum_cls: type[Enum], enum_dict: dict[str, str]) -> None:
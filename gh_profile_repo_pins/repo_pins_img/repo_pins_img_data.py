@@ -15,6 +15,7 @@ class RepoPinImgData:
     pull_request_count: int
     contributor_count: int
     contribution_perc: float
+    is_contribution_partial: bool
     description: str
     url: str
     primary_language_name: str
@@ -157,8 +158,16 @@ class RepoPinImgData:
                 repo_data.get(enums.RepoPinsResDictKeys.PULL_REQUESTS.value, {}) or {}
             ).get(enums.RepoPinsResDictKeys.TTL_COUNT.value, 0)
             or 0,
-            contributor_count=len(list(contributions.keys())),
+            contributor_count=(
+                repo_data.get(enums.RepoPinsResDictKeys.CONTRIBUTOR_COUNT.value)
+                or len(list(contributions.keys()))
+            ),
             contribution_perc=contribution_perc,
+            # stats from a timed-out parse or a stale checkpoint
+            is_contribution_partial=repo_data.get(
+                enums.RepoPinsResDictKeys.CONTRIBUTION_PARTIAL.value, False
+            )
+            or False,
             description=repo_data.get(enums.RepoPinsResDictKeys.DESCRIPTION.value, "")
             or "",
             url=(
@@ -220,7 +229,8 @@ class RepoPinImgData:
             f"{f"\nissues (open, help wanted): {self.issue_help_count}" if self.issue_help_count else ""}"
             f"{f"\npull requests (open): {self.pull_request_count}" if self.pull_request_count else ""}"
             f"{f"\ncontributors (default branch): {self.contributor_count}" if self.contributor_count else ""}"
-            f"{f"\ncontributions (%): {str(round(self.contribution_perc, 2)).rstrip("0").rstrip(".")}" 
+            f"{f"\ncontributions (%): {str(round(self.contribution_perc, 2)).rstrip("0").rstrip(".")}"
+            f"{" (partial)" if self.is_contribution_partial else ""}" 
             if self.contribution_perc else ""}"
             f"\ntheme: {self.theme.value if self.theme else "None"}"
             f"\nbackground image: {f"\n{str(self.bg_img)}" if self.bg_img else "None\n"}"
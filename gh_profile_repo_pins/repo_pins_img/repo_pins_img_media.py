@@ -1,8 +1,9 @@
 from gh_profile_repo_pins.repo_pins_exceptions import RepoPinImageMediaError
+from gh_profile_repo_pins.repo_pins_transport import RepoPinsTransport
 import gh_profile_repo_pins.repo_pins_enum as enums
 from gh_profile_repo_pins.utils import load_img
 from PIL import Image as im, ImageOps as im_ops
-from requests import get, Response, HTTPError
+from requests import Response, HTTPError
 from urllib.parse import urlparse
 from base64 import b64encode
 from cairosvg import svg2png
@@ -20,6 +21,7 @@ class RepoPinImgMedia:
     __IMG_DIMS: int = 1600
     __IMG_QUALITY: int = 80
     __IMG_COMPRESSION: int = 6
+    __IMG_TIME_OUT: int = 5
 
     def __init__(
         self,
@@ -92,7 +94,9 @@ class RepoPinImgMedia:
 
     def __load_url(self) -> None:
         try:
-            res: Response = get(url=self.__img, timeout=5)
+            res: Response = RepoPinsTransport.shared().get(
+                url=self.__img, time_out=self.__IMG_TIME_OUT
+            )
             res.raise_for_status()
         except HTTPError:
             raise RepoPinImageMediaError(
@@ -711,7 +711,9 @@ class RepoPinImg:
             )
             footer_x -= self.__PADDING * 0.3
             footer_x = self.__footer_txt(
-                txt=f" {str(round(self.__repo_pin_data.contribution_perc, 1)).rstrip("0").rstrip(".")}%)",
+                # approximate when the stats are partial
+                txt=f" {"~" if self.__repo_pin_data.is_contribution_partial else ""}"
+                f"{str(round(self.__repo_pin_data.contribution_perc, 1)).rstrip("0").rstrip(".")}%)",
                 txt_x=footer_x,
                 footer_y=footer_y,
             )
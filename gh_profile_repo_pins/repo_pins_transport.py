@@ -0,0 +1,105 @@
+from requests import Session, Response
+from requests.adapters import HTTPAdapter
+from threading import Lock
+
+
+class RepoPinsTransport:
+
+    __DEFAULT_TIME_OUT: int = 10
+    __DEFAULT_POOL_SIZE: int = 8
+    __DEFAULT_HEADERS: dict[str, str] = {
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    __shared_transport: "RepoPinsTransport | None" = None
+    __shared_transport_lock: Lock = Lock()
+
+    def __init__(self, pool_size: int = None, time_out: int = None) -> None:
+        self.__pool_size: int = pool_size if pool_size else self.__DEFAULT_POOL_SIZE
+        self.__time_out: int = time_out if time_out else self.__DEFAULT_TIME_OUT
+
+        # bounded keep-alive pool, blocking (instead of discarding) when all connections are in use
+        self.__adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=self.__pool_size,
+            pool_maxsize=self.__pool_size,
+            pool_block=True,
+        )
+        self.__session: Session = Session()
+        self.__session.headers.update(self.__DEFAULT_HEADERS)
+        self.__session.mount(prefix="https://", adapter=self.__adapter)
+        self.__session.mount(prefix="http://", adapter=self.__adapter)
+        self.__is_closed: bool = False
+
+    def __enter__(self) -> "RepoPinsTransport":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def pool_size(self) -> int:
+        return self.__pool_size
+
+    @property
+    def is_closed(self) -> bool:
+        return self.__is_closed
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] = None,
+        params: dict = None,
+        json: dict = None,
+        time_out: int | float = None,
+    ) -> Response:
+        return self.__session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            timeout=time_out if time_out else self.__time_out,
+        )
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] = None,
+        params: dict = None,
+        time_out: int | float = None,
+    ) -> Response:
+        return self.request(
+            method="GET", url=url, headers=headers, params=params, time_out=time_out
+        )
+
+    def post(
+        self,
+        url: str,
+        headers: dict[str, str] = None,
+        json: dict = None,
+        time_out: int | float = None,
+    ) -> Response:
+        return self.request(
+            method="POST", url=url, headers=headers, json=json, time_out=time_out
+        )
+
+    def close(self) -> None:
+        if not self.__is_closed:
+            self.__session.close()
+            self.__is_closed = True
+
+    @classmethod
+    def shared(cls) -> "RepoPinsTransport":
+        with cls.__shared_transport_lock:
+            if cls.__shared_transport is None or cls.__shared_transport.is_closed:
+                cls.__shared_transport = RepoPinsTransport()
+            return cls.__shared_transport
+
+    @classmethod
+    def close_shared(cls) -> None:
+        with cls.__shared_transport_lock:
+            if cls.__shared_transport is not None:
+                cls.__shared_transport.close()
+                cls.__shared_transport = None
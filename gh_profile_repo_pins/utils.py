@@ -12,6 +12,12 @@ from re import compile
 SRC_REPO_NAME: str = "readme-repo-pins-src"
 FILES_DIR: str = "files"
 IMGS_DIR: str = "imgs"
+CACHE_DIR: str = environ.get(
+    "CACHE_DIR", ".repo_pins_cache"
+)  # persisted between workflow runs with actions/cache, only if IS_CACHE
+MIRROR_CACHE_DIR: str = environ.get(
+    "MIRROR_CACHE_DIR", ".repo_pins_mirrors"
+)  # persisted with a separate actions/cache step, only if IS_CACHE_MIRRORS
 
 USERNAME: str = environ.get("GH_USERNAME", "")
 GH_API_TOKEN: str = environ.get(
@@ -75,6 +81,34 @@ IS_EXCLUDE_REPOS_CONTRIBUTED: str = environ.get("IS_EXCLUDE_REPOS_CONTRIBUTED",
 # optional config, independent to other configs, default False
 IS_CONTRIBUTION_STATS: str = environ.get("IS_CONTRIBUTION_STATS", "")
 
+# optional config, used with IS_CONTRIBUTION_STATS, default lines (commit add/del changes)
+CONTRIBUTION_STATS_METRIC: str = environ.get("CONTRIBUTION_STATS_METRIC", "")
+
+# optional config, used with IS_CONTRIBUTION_STATS, default full history (number of recent months)
+CONTRIBUTION_STATS_WINDOW: str = environ.get("CONTRIBUTION_STATS_WINDOW", "")
+
+# optional config, used with IS_CONTRIBUTION_STATS, default git (cloned commit history)
+CONTRIBUTION_STATS_BACKEND: str = environ.get("CONTRIBUTION_STATS_BACKEND", "")
+
+# optional config, used with IS_CONTRIBUTION_STATS, default each repo's .gitattributes generated and vendored paths
+CONTRIBUTION_STATS_EXCLUDE_PATHS: str = environ.get(
+    "CONTRIBUTION_STATS_EXCLUDE_PATHS", ""
+)
+
+# optional config, used with IS_CONTRIBUTION_STATS, default False (renamed files are not counted as changed lines)
+IS_CONTRIBUTION_STATS_NO_RENAMES: str = environ.get(
+    "IS_CONTRIBUTION_STATS_NO_RENAMES", ""
+)
+
+# optional config, independent to other configs, default False (concurrent asyncio fetching)
+IS_ASYNC_FETCH: str = environ.get("IS_ASYNC_FETCH", "")
+
+# optional config, independent to other configs, default False (cached API responses are reused within their TTL)
+IS_CACHE_BYPASS: str = environ.get("IS_CACHE_BYPASS", "")
+
+# optional config, used with IS_CONTRIBUTION_STATS, default False (repos are cloned for each run)
+IS_CACHE_MIRRORS: str = environ.get("IS_CACHE_MIRRORS", "")
+
 
 def parse_bg_img(bg_img: str) -> dict | str | None:
     if bg_img:
@@ -94,9 +128,27 @@ def parse_bg_img(bg_img: str) -> dict | str | None:
     return bg_img
 
 
-def parse_args() -> (
-    tuple[str, str, str, str | dict, dict | str, int, str, bool, bool, str, bool]
-):
+def parse_args() -> tuple[
+    str,
+    str,
+    str,
+    str | dict,
+    dict | str,
+    int,
+    str,
+    bool,
+    bool,
+    str,
+    bool,
+    bool,
+    bool,
+    str,
+    str,
+    str,
+    bool,
+    str,
+    bool,
+]:
     parser = ArgumentParser(
         description="GitHub API-fetch pinned/popular/contributed/select/etc repositories for a given username"
     )
@@ -176,6 +228,59 @@ def parse_args() -> (
         default=True if IS_CONTRIBUTION_STATS else False,
         help="If repository contribution stats (commit add/del changes) are/not included. Default: False.",
     )
+    parser.add_argument(
+        "--async-fetch",
+        action="store_true",
+        default=True if IS_ASYNC_FETCH else False,
+        help="If independent API requests are fetched concurrently on an asyncio event loop. Default: False.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=True if IS_CACHE_BYPASS else False,
+        help="If cached GraphQL API responses are bypassed (and refreshed). Default: False.",
+    )
+    parser.add_argument(
+        "--stats-metric",
+        type=str,
+        default=CONTRIBUTION_STATS_METRIC if CONTRIBUTION_STATS_METRIC else None,
+        help="The contribution stats metric, commit line changes or commit counts. Default: lines.",
+    )
+    parser.add_argument(
+        "--stats-window",
+        type=str,
+        default=CONTRIBUTION_STATS_WINDOW if CONTRIBUTION_STATS_WINDOW else None,
+        help="The number of recent months of commit history in contribution stats. Default: full history.",
+    )
+    parser.add_argument(
+        "--stats-backend",
+        type=str,
+        default=CONTRIBUTION_STATS_BACKEND if CONTRIBUTION_STATS_BACKEND else None,
+        help="The contribution stats source, cloned git history or the GitHub statistics API. Default: git.",
+    )
+    parser.add_argument(
+        "--cache-mirrors",
+        action="store_true",
+        default=True if IS_CACHE_MIRRORS else False,
+        help="If public repo clones for contribution stats are kept as mirrors between runs. Default: False.",
+    )
+    parser.add_argument(
+        "--stats-exclude-paths",
+        type=str,
+        default=(
+            CONTRIBUTION_STATS_EXCLUDE_PATHS
+            if CONTRIBUTION_STATS_EXCLUDE_PATHS
+            else None
+        ),
+        help="The gitattributes style path patterns excluded from contribution stats, separated by commas. "
+        "Default: each repo's generated and vendored paths.",
+    )
+    parser.add_argument(
+        "--stats-no-renames",
+        action="store_true",
+        default=True if IS_CONTRIBUTION_STATS_NO_RENAMES else False,
+        help="If renamed files are counted as deleted and added lines, which skips costly rename detection. Default: False.",
+    )
     args = parser.parse_args()
 
     exclusive_repo_name_pattern = compile(r"^\s*(?:,?\s*[\w.-]+/[\w.-]+\s*)*,?\s*$")
@@ -208,6 +313,23 @@ def parse_args() -> (
     assert (
         args.owner is None or isinstance(args.owner, str) and len(args.owner) > 0
     ), "A valid GitHub repo owner must be provided and must match ownership of the repo code/workflow is executed from."
+    assert args.stats_metric is None or args.stats_metric.lower() in [
+        e.value for e in list(enums.RepoPinStatsMetricEnum.__members__.values())
+    ], (
+        f"The contribution stats metric must match one of: "
+        f"{[e.value for e in list(enums.RepoPinStatsMetricEnum.__members__.values())]}"
+    )
+    assert (
+        args.stats_window is None
+        or args.stats_window.strip().isdigit()
+        and int(args.stats_window) > 0
+    ), "The contribution stats window must be an int number of months greater than 0."
+    assert args.stats_backend is None or args.stats_backend.lower() in [
+        e.value for e in list(enums.RepoPinStatsBackendEnum.__members__.values())
+    ], (
+        f"The contribution stats backend must match one of: "
+        f"{[e.value for e in list(enums.RepoPinStatsBackendEnum.__members__.values())]}"
+    )
 
     if args.theme:
         try:
@@ -233,6 +355,14 @@ def parse_args() -> (
         args.not_contributed,
         args.owner,
         args.stats,
+        args.async_fetch,
+        args.no_cache,
+        args.stats_metric,
+        args.stats_window,
+        args.stats_backend,
+        args.cache_mirrors,
+        args.stats_exclude_paths,
+        args.stats_no_renames,
     )
 
 